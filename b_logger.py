@@ -3,10 +3,14 @@
 import os
 import sys
 import json
+import heapq
 import signal
+import stat
+import atexit
+import functools
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from blessed import Terminal
-from dateutil import parser
+from itertools import groupby
 from typing import Optional
 
 try:
@@ -14,32 +18,330 @@ try:
 except Exception:  # pragma: no cover
     readline = None
 
+try:
+    import orjson  # Optional, much faster JSON encoding/decoding.
+except Exception:  # pragma: no cover
+    orjson = None
+
+# Status markers are shared (interned) objects; loaded logs reuse them.
+_CHECK = sys.intern("✅")
+_CROSS = sys.intern("❌")
+
+# The banner never changes, so it is read once at import.
+try:
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'banner.txt'), 'r') as _f:
+        _BANNER = _f.read()
+except FileNotFoundError:
+    _BANNER = "B-LOGGER\nYour Retro B-logging Companion"
+
+# Synchronized output (DEC mode 2026): the terminal shows a frame only once it is complete.
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
+
+# One row of the log history table.
+_LOG_ROW = "%d. %s %s - %s hours [Q-> %s] [J-> %s]"
+
+# Rule printed between days and sections.
+_SEP = "-" * 72
+
+# A full workday (8 hours), in minutes.
+_FULL_DAY_MINUTES = 8 * 60
+
+# Width of the statistics bar charts, and a full-width bar to slice them from.
+_CHART_WIDTH = 50
+_BAR = "█" * _CHART_WIDTH
+
+# Status fields (with their labels) updated by each q/j/b choice.
+_STATUS_CHOICES = {
+    'q': (("q_status", "Q"),),
+    'j': (("jira_status", "Jira"),),
+    'b': (("q_status", "Q"), ("jira_status", "Jira")),
+}
+
+# Status fields of a migration script, with their prompt labels.
+_SCRIPT_STATUSES = (
+    ("demo_status", "Demo"),
+    ("stage_status", "Stage"),
+    ("release_status", "Release notes"),
+)
+
+# Answers that pick one of the last 5 days in the date prompts.
+_DAY_PICKS = ("1", "2", "3", "4", "5")
+
+# Static settings menus, printed with a single call each.
+_SETTINGS_MENU = "\n1. Manage Log Types\n2. Configure Sprint Settings\n3. View Current Settings\n4. Return to Main Menu"
+_LOG_TYPES_MENU = "\n1. Add New Log Type\n2. Edit Existing Log Type\n3. Delete Log Type\n4. Return to Settings"
+_SPRINT_MENU = "\n1. Change Sprint Start Date\n2. Change Sprint Duration\n3. Return to Settings"
+
+# Static main menu and submenus; the highlighted header is added when painting.
+_MAIN_MENU = "\n1. Logs\n2. Sprint\n3. Migration script\n4. Important Links\n5. Settings\n6. Help\n7. Statistics\n8. About\n9. Exit"
+_LOGS_MENU = "\n1. Create log\n2. View logs\n3. Edit log\n4. Delete log\n5. Mark as checked\n6. Mark as unchecked\n7. Edit subtasks\n8. View logs for a date\n9. Mark all day as checked\n10. Mark all day as unchecked\n0. Back to main menu"
+_SPRINT_VIEWS_MENU = "\n1. View current sprint\n2. View sprint by date\n3. View sprint history\n0. Back to main menu"
+_MIGRATION_MENU = "\n1. Create migration script\n2. View migration scripts\n3. Edit migration script\n4. Delete migration script\n0. Back to main menu"
+_LINKS_MENU = "\n1. Add link\n2. View links\n3. Edit link\n4. Delete link\n0. Back to main menu"
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj as indented UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path, data: bytes, fsync=False):
+    """Write data to path via a temp file and rename, so a crash never truncates it."""
+    tmp = path + ".tmp"
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)  # Keep the existing file's permissions
+    except FileNotFoundError:
+        mode = None  # New file: default mode (0o666 minus umask), as open() gives
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            if mode is not None:
+                os.chmod(tmp, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:  # Only for logs.json; the rename alone already rules out truncation
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a half-written temp file behind
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _parse_dmy(date_str):
+    """Parse DD.MM.YYYY; the zero-padded form is sliced, anything else goes to strptime."""
+    if (len(date_str) == 10 and date_str[2] == date_str[5] == '.' and date_str.isascii()
+            and date_str[:2].isdigit() and date_str[3:5].isdigit() and date_str[6:].isdigit()):
+        try:
+            return datetime(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+        except ValueError:
+            pass  # Let strptime raise its usual error
+    return datetime.strptime(date_str, "%d.%m.%Y")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_ymd(date_str):
+    """Parse a YYYY-MM-DD date (the sprint start setting), memoized."""
+    if (len(date_str) == 10 and date_str[4] == date_str[7] == '-' and date_str.isascii()
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            pass  # Let strptime raise its usual error
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=512)
+def _sprint_dates(first_sprint_start, sprint_duration, sprint_number):
+    """(start, end) of a sprint; keyed on the config too, so edits need no invalidation."""
+    sprint_start = first_sprint_start + timedelta(days=sprint_duration * sprint_number)
+    sprint_end = sprint_start + timedelta(days=sprint_duration - 1)  # Sprint ends one day before next sprint
+    return sprint_start, sprint_end
+
+
+def _sprint_index(date, first_sprint_start, sprint_duration):
+    """Number of the sprint containing date (negative before the first sprint)."""
+    return (date - first_sprint_start).days // sprint_duration
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_hours(hours_str):
+    """Parse hours string into total minutes"""
+    if not hours_str or hours_str.lower() == 'ongoing':
+        return 0
+    
+    total_minutes = 0
+    hours_str = hours_str.lower().replace('hours', '').strip()
+    
+    # Handle hours
+    if 'h' in hours_str:
+        hours_part = hours_str.partition('h')[0]
+        try:
+            total_minutes += int(hours_part.strip()) * 60
+        except ValueError:
+            pass
+    elif hours_str.isdigit():
+        # Handle case like "1 hours"
+        try:
+            total_minutes += int(hours_str) * 60
+        except ValueError:
+            pass
+    
+    # Handle minutes
+    if 'm' in hours_str:
+        minutes_part = hours_str.partition('m')[0]
+        if 'h' in minutes_part:
+            minutes_part = minutes_part.rpartition('h')[2]
+        try:
+            total_minutes += int(minutes_part.strip())
+        except ValueError:
+            pass
+    
+    return total_minutes
+
+
 class BLogger:
     def __init__(self):
-        self.term = Terminal()
         self.logs = []
+        self._date_cache = {}
         self.current_log = None
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.log_file = os.path.join(self.script_dir, "logs.json")
         self.settings_file = os.path.join(self.script_dir, "settings.json")
         self.scripts_file = os.path.join(self.script_dir, "scripts.json")
+        self.links_file = os.path.join(self.script_dir, "links.json")
+        self.log_backup_file = os.path.join(self.script_dir, "backup", "logs_backup.json")
+        self.links_backup_file = os.path.join(self.script_dir, "backup", "links_backup.json")
+        self.history_file = os.path.join(self.script_dir, ".b_logger_history")
         self.running = True
+        self._screen_dirty = True
+        self._logs_dirty = False
+        self._saved_logs = None  # Bytes of the last logs.json written by save_logs
+        self._scripts_text = self._links_text = None  # Rendered listings; save_scripts/save_links drop them
         self.load_settings()
         self.load_logs()
-        self.load_scripts()
-        self.banner = None
-        self.load_banner()
-        self.links = self.load_links()
+        # Pending log changes are written even on Ctrl+C (sys.exit) or EOF
+        atexit.register(self._flush_logs)
+        self.banner = _BANNER
         self.input_history = []
         self.history_index = 0
         self._configure_readline()
         
+        # Submenu choice -> action, looked up instead of walking an if/elif chain
+        self._logs_actions = {
+            "1": self.create_new_log,
+            "2": self._view_logs_and_wait,
+            "3": self.edit_log,
+            "4": self.delete_log,
+            "5": self.mark_as_checked,
+            "6": self.mark_as_unchecked,
+            "7": self.edit_subtasks,
+            "8": self.view_logs_for_date,
+            "9": self.mark_all_day_as_checked,
+            "10": self.mark_all_day_as_unchecked,
+        }
+        self._sprint_actions = {
+            "1": self.view_sprint_logs,
+            "2": self._view_chosen_sprint,
+            "3": self.view_sprint_history,
+        }
+        self._migration_actions = {
+            "1": self.log_migration_script,
+            "2": self.view_migration_scripts,
+            "3": self.edit_migration_script,
+            "4": self.delete_migration_script,
+        }
+        self._links_actions = {
+            "1": self.add_link,
+            "2": self.view_links,
+            "3": self.edit_link,
+            "4": self.delete_link,
+        }
+        
+        # Main menu; choices 1-4 open a submenu driven by one of the tables above
+        self._main_actions = {
+            "1": functools.partial(self._run_submenu, "Logs Menu", _LOGS_MENU, self._logs_actions),
+            "2": functools.partial(self._run_submenu, "Sprint Menu", _SPRINT_VIEWS_MENU, self._sprint_actions),
+            "3": functools.partial(self._run_submenu, "Migration Script Menu", _MIGRATION_MENU, self._migration_actions),
+            "4": functools.partial(self._run_submenu, "Important Links Menu", _LINKS_MENU, self._links_actions),
+            "5": self.manage_settings,
+            "6": self.display_help,
+            "7": self.display_statistics,
+            "8": self.display_about,
+        }
+        
         # Set up signal handler for Ctrl+C
         signal.signal(signal.SIGINT, self.handle_exit)
 
+    @functools.cached_property
+    def term(self):
+        """Terminal used for rendering; terminfo is only probed on first use."""
+        from blessed import Terminal
+        return Terminal()
+
+    @functools.cached_property
+    def scripts(self):
+        """Migration scripts; scripts.json is only read once they are needed."""
+        return self.load_scripts()
+
+    @functools.cached_property
+    def links(self):
+        """Saved links; links.json is only read once they are needed."""
+        return self.load_links()
+
+    # Escape sequences are constant for the session; resolve them once
+    @functools.cached_property
+    def _clear(self):
+        return self.term.clear
+
+    @functools.cached_property
+    def _home(self):
+        return self.term.move_y(0)
+
+    @functools.cached_property
+    def _hdr_on(self):
+        return self.term.black_on_white
+
+    @functools.cached_property
+    def _underline(self):
+        return self.term.underline
+
+    @functools.cached_property
+    def _normal(self):
+        return self.term.normal
+
+    @functools.cached_property
+    def _green(self):
+        return str(self.term.green)
+
+    @functools.cached_property
+    def _red(self):
+        return str(self.term.red)
+
+    @functools.cached_property
+    def _cyan(self):
+        return str(self.term.cyan)
+
+    @functools.cached_property
+    def _yellow(self):
+        return str(self.term.yellow)
+
+    @functools.cached_property
+    def _banner_cyan(self):
+        return self.term.cyan(self.banner)
+
+    @functools.cached_property
+    def _sync(self):
+        """(begin, end) synchronized-output brackets; empty when not styling a tty."""
+        if self.term.does_styling:
+            return _SYNC_BEGIN, _SYNC_END
+        return "", ""
+
+    @functools.cached_property
+    def _banner_blob(self):
+        """Full banner screen (clear, home, banner, spacing) as one string."""
+        begin, end = self._sync
+        return f"{begin}{self._clear}\n{self._home}\n{self._banner_cyan}\n\n\n{end}"
+
     def daily_target_minutes(self) -> int:
         """Daily target: 8 hours."""
-        return 8 * 60
+        return _FULL_DAY_MINUTES
 
     def format_minutes_signed(self, total_minutes: int) -> str:
         """Format minutes, supporting negative values (e.g. "-2h 15m")."""
@@ -57,26 +359,23 @@ class BLogger:
         """Color remaining time to 8h: cyan (>0), green (=0), red (<0)."""
         remaining_str = self.format_minutes_signed(remaining_minutes)
         if remaining_minutes > 0:
-            return self.term.cyan(remaining_str)
+            return f"{self._cyan}{remaining_str}{self._normal}"
         if remaining_minutes == 0:
-            return self.term.green(remaining_str)
-        return self.term.red(remaining_str)
+            return f"{self._green}{remaining_str}{self._normal}"
+        return f"{self._red}{remaining_str}{self._normal}"
 
     def _configure_readline(self) -> None:
         """
-        Configure readline/libedit keybindings (best-effort).
+        Configure readline/libedit keybindings and input history (best-effort).
 
-        This fixes common Mac terminal behavior where Option+Arrow sends an
-        escape sequence. We map it to beginning/end-of-line for a Mac-like feel.
+        Key bindings live in the bundled inputrc (GNU readline) and editrc
+        (libedit) files, which are read in a single call. They fix common Mac
+        terminal behavior where Option+Arrow sends an escape sequence, mapping
+        it to beginning/end-of-line for a Mac-like feel.
         """
         if readline is None:
             return
 
-        try:
-            readline.parse_and_bind("set editing-mode emacs")
-        except Exception:
-            pass
-
         # Detect macOS libedit-backed "readline" (common on system Python builds).
         is_libedit = False
         try:
@@ -84,39 +383,27 @@ class BLogger:
         except Exception:
             is_libedit = False
 
-        if is_libedit:
-            # libedit uses different bind command names.
-            # Note: In most terminals, Option == Alt (escape prefix).
-            libedit_binds = [
-                r'bind "\e[1;3D" ed-move-to-beg',  # Option+Left (xterm)
-                r'bind "\e[1;3C" ed-move-to-end',  # Option+Right (xterm)
-                r'bind "\e[1;9D" ed-move-to-beg',  # Option+Left (some terminals)
-                r'bind "\e[1;9C" ed-move-to-end',  # Option+Right (some terminals)
-                r'bind "\e[3D" ed-move-to-beg',    # Fallback
-                r'bind "\e[3C" ed-move-to-end',    # Fallback
-            ]
-            for bind in libedit_binds:
-                try:
-                    readline.parse_and_bind(bind)
-                except Exception:
-                    pass
-        else:
-            # GNU readline style.
-            sequences = [
-                r'"\e[1;3D": beginning-of-line',  # Option+Left (xterm)
-                r'"\e[1;3C": end-of-line',        # Option+Right (xterm)
-                r'"\e[1;9D": beginning-of-line',  # Option+Left (some terminals)
-                r'"\e[1;9C": end-of-line',        # Option+Right (some terminals)
-                r'"\e[3D": beginning-of-line',    # Fallback
-                r'"\e[3C": end-of-line',          # Fallback
-                r'"\e;3D": beginning-of-line',    # Some terminals omit '['
-                r'"\e;3C": end-of-line',          # Some terminals omit '['
-            ]
-            for bind in sequences:
-                try:
-                    readline.parse_and_bind(bind)
-                except Exception:
-                    pass
+        # Bindings only matter for interactive input; skip them for piped stdin.
+        if sys.stdin.isatty():
+            rc_file = os.path.join(self.script_dir, "editrc" if is_libedit else "inputrc")
+            try:
+                readline.read_init_file(rc_file)
+            except OSError:
+                pass
+
+        # Keep input history across sessions.
+        try:
+            readline.read_history_file(self.history_file)
+        except OSError:
+            pass
+        readline.set_history_length(1000)
+        atexit.register(self._save_history)
+
+    def _save_history(self) -> None:
+        try:
+            readline.write_history_file(self.history_file)
+        except OSError:
+            pass
 
     def ask(self, text: str) -> str:
         """
@@ -124,6 +411,9 @@ class BLogger:
         This uses builtin input(); line-editing is provided by readline if
         available (configured in __init__).
         """
+        # Anything typed or prompted for means the banner screen was drawn over
+        self._screen_dirty = True
+        sys.stdout.flush()  # Whatever was drawn must be visible before we block
         return input(text)
 
     def handle_exit(self, signum, frame):
@@ -132,41 +422,94 @@ class BLogger:
         self.running = False
         sys.exit(0)
 
-    def load_banner(self):
-        try:
-            banner_path = os.path.join(self.script_dir, 'banner.txt')
-            with open(banner_path, 'r') as f:
-                self.banner = f.read()
-        except FileNotFoundError:
-            self.banner = "B-LOGGER\nYour Retro B-logging Companion"
-
     def display_banner(self):
-        print(self.term.clear)
-        print(self.term.move_y(0))
-        print(self.term.cyan(self.banner))
-        print("\n")  # Add some space after banner
+        sys.stdout.write(self._banner_blob)
 
     def load_logs(self):
         if os.path.exists(self.log_file):
-            with open(self.log_file, 'r') as f:
-                self.logs = json.load(f)
+            with open(self.log_file, 'rb') as f:
+                self.logs = _json_loads(f.read())
+            # Many logs repeat the same ticket, hours and status strings
+            intern = sys.intern
+            for log in self.logs:
+                for field in ('ticket', 'hours', 'q_status', 'jira_status'):
+                    value = log.get(field)
+                    if isinstance(value, str):
+                        log[field] = intern(value)
+            # Keep logs sorted by date (oldest first); inserts preserve this order.
+            self.logs.sort(key=self._date_key)
+        self._logs_stat = self._log_file_stat()
+        self._saved_logs = None  # Not written by save_logs yet
+
+    def _log_file_stat(self):
+        """(mtime, size) of logs.json, or None if it does not exist."""
+        try:
+            st = os.stat(self.log_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _bisect_logs(self, date, after=False):
+        """Index of the first log dated on/after date (strictly after it if after=True)."""
+        lo, hi = 0, len(self.logs)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key = self._date_key(self.logs[mid])
+            if key < date or (after and key == date):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _logs_between(self, start, end):
+        """Logs dated within [start, end], found by bisecting the sorted self.logs."""
+        return self.logs[self._bisect_logs(start):self._bisect_logs(end, after=True)]
+
+    def _logs_on(self, date_str):
+        """Logs whose timestamp date is exactly date_str, in their stored order."""
+        day = self._parse_date(date_str)
+        return [log for log in self._logs_between(day, day)
+                if log['timestamp'].partition(' ')[0] == date_str]
+
+    def _insert_log(self, log):
+        """Insert a log after any existing logs from the same or earlier dates."""
+        self.logs.insert(self._bisect_logs(self._date_key(log), after=True), log)
+
+    def _parse_date(self, date_str):
+        """Parse a DD.MM.YYYY date string, memoized for the session."""
+        key = self._date_cache.get(date_str)
+        if key is None:
+            key = _parse_dmy(date_str)
+            self._date_cache[date_str] = key
+        return key
+
+    def _date_key(self, log):
+        """Parsed date of a log's timestamp (the sort key for self.logs)."""
+        return self._parse_date(log['timestamp'].partition(' ')[0])
+
+    def _flush_logs(self):
+        """Write logs.json if changes were deferred with _logs_dirty."""
+        if self._logs_dirty:
+            self.save_logs()
 
     def save_logs(self):
-        # Sort logs by date before saving (oldest first)
-        self.logs.sort(key=lambda x: datetime.strptime(x['timestamp'].split()[0], "%d.%m.%Y"))
-        
+        self._logs_dirty = False
+        data = _json_dumps(self.logs)
+        # Edits that kept every value (edit_log/edit_subtasks answered with Enter) change nothing on disk
+        if data == self._saved_logs and self._log_file_stat() == self._logs_stat:
+            return
+
         # Save to main logs file
-        with open(self.log_file, 'w') as f:
-            json.dump(self.logs, f, indent=2)
+        _write_atomic(self.log_file, data, fsync=True)
+        self._logs_stat = self._log_file_stat()
             
         # Save to backup file
-        backup_file = os.path.join(self.script_dir, "backup", "logs_backup.json")
-        with open(backup_file, 'w') as f:
-            json.dump(self.logs, f, indent=2)
+        _write_atomic(self.log_backup_file, data)
+        self._saved_logs = data
 
     def create_new_log(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Create New Log" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Create New Log" + self._normal)
         
         # Ask about custom date
         while True:
@@ -184,7 +527,7 @@ class BLogger:
                     if custom_date.lower() in ['0', 'exit']:
                         return
                     # Validate date format
-                    datetime.strptime(custom_date, "%d.%m.%Y")
+                    self._parse_date(custom_date)
                     current_time = f"{custom_date} {datetime.now().strftime('%H:%M:%S')}"
                     break
                 except ValueError:
@@ -197,11 +540,11 @@ class BLogger:
         if ticket.lower() in ['0', 'exit']:
             return
 
-        log_date = current_time.split()[0]
+        log_date = current_time.partition(' ')[0]
         day_total_minutes = sum(
             self.parse_hours(log.get('hours', ''))
             for log in self.logs
-            if log['timestamp'].split()[0] == log_date
+            if log['timestamp'].partition(' ')[0] == log_date
         )
         logged_so_far = self.format_hours(day_total_minutes) or "0h"
         remaining_minutes = self.daily_target_minutes() - day_total_minutes
@@ -209,7 +552,7 @@ class BLogger:
         for_line = (
             f"For {log_date} you logged {logged_so_far} and still have left {remaining_str}."
         )
-        print(self.term.cyan(for_line))
+        print(f"{self._cyan}{for_line}{self._normal}")
 
         hours = self.ask("Enter hours (e.g., 1h 30m or just 30m): ")
         if hours.lower() in ['0', 'exit']:
@@ -227,27 +570,27 @@ class BLogger:
             "timestamp": current_time,
             "ticket": ticket,
             "hours": hours,
-            "q_status": "❌",
-            "jira_status": "❌",
+            "q_status": _CROSS,
+            "jira_status": _CROSS,
             "subtasks": []
         }
         
         self.update_status()
-        self.logs.append(self.current_log)
+        self._insert_log(self.current_log)
         self.save_logs()
 
     def update_status(self):
-        print(self.term.clear)
+        print(self._clear)
         print(f"Current log: {self.current_log['ticket']} - {self.current_log['hours']} hours")
         
         # Ask if user wants to update hours
         update_hours = self.ask("Do you want to update hours? (y/n): ").lower()
         if update_hours == 'y':
-            log_date = self.current_log["timestamp"].split()[0]
+            log_date = self.current_log["timestamp"].partition(' ')[0]
             day_total_minutes = sum(
                 self.parse_hours(log.get('hours', ''))
                 for log in self.logs
-                if log['timestamp'].split()[0] == log_date
+                if log['timestamp'].partition(' ')[0] == log_date
             )
             current_log_minutes = self.parse_hours(self.current_log.get("hours", ""))
             total_without_current = day_total_minutes - current_log_minutes
@@ -258,7 +601,7 @@ class BLogger:
             for_line = (
                 f"For {log_date} you logged {logged_so_far} and still have left {remaining_str}."
             )
-            print(self.term.cyan(for_line))
+            print(f"{self._cyan}{for_line}{self._normal}")
 
             new_hours = self.ask("Enter new hours: ")
             new_minutes = self.parse_hours(new_hours)
@@ -273,57 +616,29 @@ class BLogger:
         q_status = self.ask("Update Q log status (x for ❌, c for ✅): ").lower()
         jira_status = self.ask("Update Jira log status (x for ❌, c for ✅): ").lower()
         
-        self.current_log["q_status"] = "✅" if q_status == "c" else "❌"
-        self.current_log["jira_status"] = "✅" if jira_status == "c" else "❌"
+        self.current_log["q_status"] = _CHECK if q_status == "c" else _CROSS
+        self.current_log["jira_status"] = _CHECK if jira_status == "c" else _CROSS
         
+        subtasks = self.current_log["subtasks"]
         while True:
             subtask = self.ask("Add subtask? (y/n): ").lower()
             if subtask != "y":
                 break
                 
             subtask_desc = self.ask("Enter subtask description: ")
-            self.current_log["subtasks"].append(subtask_desc)
+            subtasks.append(subtask_desc)
             print(f"Added subtask: {subtask_desc}")
             print("Current subtasks:")
-            for i, task in enumerate(self.current_log["subtasks"], 1):
+            for i, task in enumerate(subtasks, 1):
                 print(f"{i}. {task}")
             print()  # Add empty line for better readability
 
-    def parse_hours(self, hours_str):
-        """Parse hours string into total minutes"""
-        if not hours_str or hours_str.lower() == 'ongoing':
-            return 0
-        
-        total_minutes = 0
-        hours_str = hours_str.lower().replace('hours', '').strip()
-        
-        # Handle hours
-        if 'h' in hours_str:
-            hours_part = hours_str.split('h')[0]
-            try:
-                total_minutes += int(hours_part.strip()) * 60
-            except ValueError:
-                pass
-        elif hours_str.isdigit():
-            # Handle case like "1 hours"
-            try:
-                total_minutes += int(hours_str.strip()) * 60
-            except ValueError:
-                pass
-        
-        # Handle minutes
-        if 'm' in hours_str:
-            minutes_part = hours_str.split('m')[0]
-            if 'h' in minutes_part:
-                minutes_part = minutes_part.split('h')[-1]
-            try:
-                total_minutes += int(minutes_part.strip())
-            except ValueError:
-                pass
-        
-        return total_minutes
+    # Shared with the module-level cache; self is not needed
+    parse_hours = staticmethod(_parse_hours)
 
-    def format_hours(self, total_minutes):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def format_hours(total_minutes):
         """Format total minutes into hours and minutes string"""
         if total_minutes == 0:
             return ""
@@ -334,53 +649,49 @@ class BLogger:
         return f"{hours}h {minutes}m"
 
     def display_logs(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Log History" + self.term.normal)
-        
-        # Sort logs by date before displaying (oldest first)
-        sorted_logs = sorted(self.logs, key=lambda x: datetime.strptime(x['timestamp'].split()[0], "%d.%m.%Y"))
-        
-        current_date = None
-        day_total_minutes = 0
-        
-        for i, log in enumerate(sorted_logs):
-            log_date = log['timestamp'].split()[0]
-            
-            # Add separator and total hours if date changes
-            if current_date is not None and log_date != current_date:
-                total_hours = self.format_hours(day_total_minutes)
-                if total_hours:
-                    # Check if total is exactly 8h
-                    if day_total_minutes == 480:  # 8 hours = 480 minutes
-                        print(f"\nTotal for {current_date}: {self.term.green(total_hours)}")
-                    else:
-                        print(f"\nTotal for {current_date}: {self.term.red(total_hours)}")
-                    print("-" * 72)  # Separator line after total
-                print("-" * 72)  # Separator line between days
-                day_total_minutes = 0
+        lines = [
+            str(self._clear),
+            self._home + self._hdr_on + "Log History" + self._normal,
+        ]
+        
+        # Bind hot names locally for the per-row loop
+        append = lines.append
+        extend = lines.extend
+        parse_hours = self.parse_hours
+        format_hours = self.format_hours
+        green, red, normal = self._green, self._red, self._normal
+        
+        # self.logs is kept sorted by date (oldest first), so each day is one run
+        days = groupby(self.logs, key=lambda log: log['timestamp'].partition(' ')[0])
+        i = 0
+        for day_index, (log_date, day_logs) in enumerate(days):
+            if day_index:
+                append(_SEP)  # Separator line between days
             
-            current_date = log_date
-            print(f"{i+1}. {log['timestamp']} {log['ticket']} - {log['hours']} hours [Q-> {log['q_status']}] [J-> {log['jira_status']}]")
-            if log['subtasks']:
-                for subtask in log['subtasks']:
-                    print(f"   └─ {subtask}")
+            day_total_minutes = 0
+            for log in day_logs:
+                i += 1
+                hours = log['hours']
+                append(_LOG_ROW % (i, log['timestamp'], log['ticket'], hours, log['q_status'], log['jira_status']))
+                subtasks = log['subtasks']
+                if subtasks:
+                    extend([f"   └─ {subtask}" for subtask in subtasks])
+                day_total_minutes += parse_hours(hours)
             
-            # Add to day total
-            day_total_minutes += self.parse_hours(log['hours'])
-        
-        # Add total for the last day
-        if day_total_minutes > 0:
-            total_hours = self.format_hours(day_total_minutes)
-            # Check if total is exactly 8h
-            if day_total_minutes == 480:  # 8 hours = 480 minutes
-                print(f"\nTotal for {current_date}: {self.term.green(total_hours)}")
-            else:
-                print(f"\nTotal for {current_date}: {self.term.red(total_hours)}")
-            print("-" * 72)  # Separator line after total
+            if day_total_minutes > 0:
+                total_hours = format_hours(day_total_minutes)
+                # Check if total is exactly 8h
+                color = green if day_total_minutes == _FULL_DAY_MINUTES else red
+                append(f"\nTotal for {log_date}: {color}{total_hours}{normal}")
+                append(_SEP)  # Separator line after total
+
+        # Emit the whole table with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def edit_log(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Edit Log" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Edit Log" + self._normal)
         self.display_logs()
         try:
             log_index = int(self.ask("\nEnter log number to edit (0 to exit): ")) - 1
@@ -388,8 +699,8 @@ class BLogger:
                 return
             
             if 0 <= log_index < len(self.logs):
-                print(self.term.clear)  # Clear screen after log selection
-                print(self.term.move_y(0) + self.term.black_on_white + f"Editing Log {log_index + 1}" + self.term.normal)
+                print(self._clear)  # Clear screen after log selection
+                print(self._home + self._hdr_on + f"Editing Log {log_index + 1}" + self._normal)
                 self.current_log = self.logs[log_index]
                 
                 # Ask if user wants to edit description
@@ -407,7 +718,7 @@ class BLogger:
             print("Invalid input")
 
     def delete_log(self):
-        print(self.term.clear)
+        print(self._clear)
         self.display_logs()
         try:
             log_index = int(self.ask("Enter log number to delete (0 to exit): ")) - 1
@@ -425,217 +736,187 @@ class BLogger:
             print("Invalid input")
             self.ask("\nPress Enter to continue...")
 
+    def _frame(self, lines):
+        """Screen clear plus lines as one synchronized frame, ready for a single write."""
+        begin, end = self._sync
+        return begin + self._clear + "\n" + "\n".join(lines) + "\n" + end
+
     def reset_screen(self):
-        """Clear screen and show banner"""
-        print(self.term.clear)
+        """Clear screen and show banner, unless nothing was drawn since the last reset"""
+        if not self._screen_dirty:
+            return
         self.display_banner()
+        sys.stdout.flush()  # End of a paint: show it even if stdout is block-buffered
+        self._screen_dirty = False
+
+    @functools.cached_property
+    def _help_text(self):
+        """The help screen never changes, so it is composed once."""
+        lines = [
+            str(self._clear),
+            self._home + self._hdr_on + "B-LOGGER Help" + self._normal,
+        ]
+        
+        lines.append("\n" + self._underline + "Main Features:" + self._normal)
+        lines.append("1. Create and manage work logs with timestamps")
+        lines.append("2. Track hours worked on different tasks")
+        lines.append("3. Mark tasks as completed in multiple systems")
+        lines.append("4. Add subtasks to main tasks")
+        lines.append("5. View and edit existing logs")
+        lines.append("6. Calculate total hours worked per workday")
+        lines.append("7. Support for custom dates")
+        lines.append("8. Sprint-based log organization")
+        lines.append("9. Customizable log types and sprint settings")
+        lines.append("10. Workday-based statistics and reporting")
+        
+        lines.append("\n" + self._underline + "Settings:" + self._normal)
+        lines.append("You can customize:")
+        lines.append("- Log Types: Add, edit, or remove different types of logs")
+        lines.append("  Each log type can track its own completion status")
+        lines.append("  Example: Q, Jira, GitHub, etc.")
+        lines.append("  Custom prefixes for each type")
+        lines.append("- Sprint Configuration: Set sprint start date and duration")
+        lines.append("Access settings from the main menu (option 10)")
+        
+        lines.append("\n" + self._underline + "How to Input Hours:" + self._normal)
+        lines.append("You can input hours in several formats:")
+        lines.append("- 1h        - One hour")
+        lines.append("- 30m       - Thirty minutes")
+        lines.append("- 1h 30m    - One hour and thirty minutes")
+        lines.append("- ongoing   - For tasks still in progress")
+        
+        lines.append("\n" + self._underline + "Examples:" + self._normal)
+        lines.append("2h        # 2 hours")
+        lines.append("45m       # 45 minutes")
+        lines.append("1h 15m    # 1 hour and 15 minutes")
+        lines.append("2h 30m    # 2 hours and 30 minutes")
+        lines.append("ongoing   # Task in progress (not counted in totals)")
+        
+        lines.append("\n" + self._underline + "Status Indicators:" + self._normal)
+        lines.append("✅ - Task is completed")
+        lines.append("❌ - Task is not completed")
+        lines.append("Each log type can have its own completion status")
+        lines.append("Example: A task can be completed in Q but not in Jira")
+        
+        lines.append("\n" + self._underline + "Statistics:" + self._normal)
+        lines.append("- Shows data for the last 10 workdays")
+        lines.append("- Excludes weekends automatically")
+        lines.append("- Displays completion status for each log type")
+        lines.append("- Shows hours worked per workday")
+        lines.append("- Lists incomplete tasks by type")
+        lines.append("- Visual charts for hours and logs per day")
+        
+        lines.append("\n" + self._underline + "Custom Dates:" + self._normal)
+        lines.append("When creating a new log, you can use a custom date")
+        lines.append("Format: DD.MM.YYYY")
+        lines.append("Example: 28.04.2024")
+        
+        lines.append("\n" + self._underline + "Sprint Features:" + self._normal)
+        lines.append("- View current sprint logs")
+        lines.append("- View sprint history")
+        lines.append("- Automatic sprint date calculation")
+        lines.append("- Distinct ticket tracking")
+        lines.append("- Sprint duration and start date configuration")
+        
+        lines.append("\n" + self._underline + "Keyboard Navigation:" + self._normal)
+        lines.append("- Use arrow keys to navigate through input history")
+        lines.append("- Use backspace to delete characters")
+        lines.append("- Press Enter to confirm inputs")
+        lines.append("- Press 0 or type 'exit' to return to previous menu")
+        lines.append("- Press Ctrl+C to exit the program")
+        
+        lines.append("\n" + self._underline + "Tips:" + self._normal)
+        lines.append("- Use settings to customize log types and sprint configuration")
+        lines.append("- Add subtasks to better organize your work")
+        lines.append("- Mark tasks as checked/unchecked to track progress")
+        lines.append("- View sprint history to see past work")
+        lines.append("- Use custom dates for historical entries")
+        lines.append("- Check statistics to monitor your work patterns")
+
+        return "\n".join(lines) + "\n"
 
     def display_help(self):
         """Display help information"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "B-LOGGER Help" + self.term.normal)
-        
-        print("\n" + self.term.underline + "Main Features:" + self.term.normal)
-        print("1. Create and manage work logs with timestamps")
-        print("2. Track hours worked on different tasks")
-        print("3. Mark tasks as completed in multiple systems")
-        print("4. Add subtasks to main tasks")
-        print("5. View and edit existing logs")
-        print("6. Calculate total hours worked per workday")
-        print("7. Support for custom dates")
-        print("8. Sprint-based log organization")
-        print("9. Customizable log types and sprint settings")
-        print("10. Workday-based statistics and reporting")
-        
-        print("\n" + self.term.underline + "Settings:" + self.term.normal)
-        print("You can customize:")
-        print("- Log Types: Add, edit, or remove different types of logs")
-        print("  Each log type can track its own completion status")
-        print("  Example: Q, Jira, GitHub, etc.")
-        print("  Custom prefixes for each type")
-        print("- Sprint Configuration: Set sprint start date and duration")
-        print("Access settings from the main menu (option 10)")
-        
-        print("\n" + self.term.underline + "How to Input Hours:" + self.term.normal)
-        print("You can input hours in several formats:")
-        print("- 1h        - One hour")
-        print("- 30m       - Thirty minutes")
-        print("- 1h 30m    - One hour and thirty minutes")
-        print("- ongoing   - For tasks still in progress")
-        
-        print("\n" + self.term.underline + "Examples:" + self.term.normal)
-        print("2h        # 2 hours")
-        print("45m       # 45 minutes")
-        print("1h 15m    # 1 hour and 15 minutes")
-        print("2h 30m    # 2 hours and 30 minutes")
-        print("ongoing   # Task in progress (not counted in totals)")
-        
-        print("\n" + self.term.underline + "Status Indicators:" + self.term.normal)
-        print("✅ - Task is completed")
-        print("❌ - Task is not completed")
-        print("Each log type can have its own completion status")
-        print("Example: A task can be completed in Q but not in Jira")
-        
-        print("\n" + self.term.underline + "Statistics:" + self.term.normal)
-        print("- Shows data for the last 10 workdays")
-        print("- Excludes weekends automatically")
-        print("- Displays completion status for each log type")
-        print("- Shows hours worked per workday")
-        print("- Lists incomplete tasks by type")
-        print("- Visual charts for hours and logs per day")
-        
-        print("\n" + self.term.underline + "Custom Dates:" + self.term.normal)
-        print("When creating a new log, you can use a custom date")
-        print("Format: DD.MM.YYYY")
-        print("Example: 28.04.2024")
-        
-        print("\n" + self.term.underline + "Sprint Features:" + self.term.normal)
-        print("- View current sprint logs")
-        print("- View sprint history")
-        print("- Automatic sprint date calculation")
-        print("- Distinct ticket tracking")
-        print("- Sprint duration and start date configuration")
-        
-        print("\n" + self.term.underline + "Keyboard Navigation:" + self.term.normal)
-        print("- Use arrow keys to navigate through input history")
-        print("- Use backspace to delete characters")
-        print("- Press Enter to confirm inputs")
-        print("- Press 0 or type 'exit' to return to previous menu")
-        print("- Press Ctrl+C to exit the program")
-        
-        print("\n" + self.term.underline + "Tips:" + self.term.normal)
-        print("- Use settings to customize log types and sprint configuration")
-        print("- Add subtasks to better organize your work")
-        print("- Mark tasks as checked/unchecked to track progress")
-        print("- View sprint history to see past work")
-        print("- Use custom dates for historical entries")
-        print("- Check statistics to monitor your work patterns")
-        
+        sys.stdout.write(self._help_text)
         self.ask("\nPress Enter to return to main menu...")
 
     def display_about(self):
         """Display about information"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "About B-Logger" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "About B-Logger" + self._normal)
 
-        print("\n" + self.term.underline + "B-Logger" + self.term.normal)
+        print("\n" + self._underline + "B-Logger" + self._normal)
         print("A terminal-based time logging application that helps you track your work tasks and their status.")
 
-        print("\n" + self.term.underline + "Author:" + self.term.normal)
+        print("\n" + self._underline + "Author:" + self._normal)
         print("  Edde")
 
-        print("\n" + self.term.underline + "Version:" + self.term.normal)
+        print("\n" + self._underline + "Version:" + self._normal)
         print("  V1.0.12")
 
-        print("\n" + self.term.underline + "GitHub:" + self.term.normal)
+        print("\n" + self._underline + "GitHub:" + self._normal)
         print("  https://github.com/tinrupcic5/b-logger.git")
 
-        print("\n" + self.term.underline + "License:" + self.term.normal)
+        print("\n" + self._underline + "License:" + self._normal)
         print("  Edde License")
         print("  See LICENSE file for details.")
 
         self.ask("\nPress Enter to return to main menu...")
 
     def mark_as_checked(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Mark Log as Checked" + self.term.normal)
-        self.display_logs()
-        
-        # Ask which status to update
-        while True:
-            status_choice = self.ask("\nWhich status do you want to update? (q/j/b for Q/Jira/Both, 0 to exit): ").lower()
-            if status_choice == '0':
-                return
-            if status_choice in ['q', 'j', 'b']:
-                break
-            print("Invalid choice. Please enter 'q' for Q, 'j' for Jira, 'b' for Both, or '0' to exit.")
-        
-        try:
-            log_index = int(self.ask("\nEnter log number to mark as checked (0 to exit): ")) - 1
-            if log_index == -1:
-                return
-            
-            if 0 <= log_index < len(self.logs):
-                if status_choice in ['q', 'b']:
-                    self.logs[log_index]["q_status"] = "✅"
-                if status_choice in ['j', 'b']:
-                    self.logs[log_index]["jira_status"] = "✅"
-                
-                status_updated = []
-                if status_choice in ['q', 'b']:
-                    status_updated.append("Q")
-                if status_choice in ['j', 'b']:
-                    status_updated.append("Jira")
-                
-                print(f"\nMarked log {log_index + 1} as checked for {', '.join(status_updated)}.")
-                self.save_logs()
-                
-                # Ask if user wants to mark another log
-                while True:
-                    another = self.ask("\nDo you want to mark another log as checked? (y/n): ").lower()
-                    if another == 'y':
-                        self.mark_as_checked()
-                        break
-                    elif another == 'n':
-                        break
-                    else:
-                        print("Please enter 'y' or 'n'")
-        except ValueError:
-            print("Invalid input")
-            self.ask("\nPress Enter to continue...")
+        self._mark_logs(_CHECK, "checked")
+        self._flush_logs()
 
     def mark_as_unchecked(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Mark Log as Unchecked" + self.term.normal)
-        self.display_logs()
-        
-        # Ask which status to update
+        self._mark_logs(_CROSS, "unchecked")
+        self._flush_logs()
+
+    def _mark_logs(self, status, label):
+        """Set the Q/Jira status of chosen logs, looping while the user marks more."""
         while True:
-            status_choice = self.ask("\nWhich status do you want to update? (q/j/b for Q/Jira/Both, 0 to exit): ").lower()
-            if status_choice == '0':
+            print(self._clear)
+            print(self._home + self._hdr_on + f"Mark Log as {label.capitalize()}" + self._normal)
+            self.display_logs()
+            
+            # Ask which status to update
+            while True:
+                status_choice = self.ask("\nWhich status do you want to update? (q/j/b for Q/Jira/Both, 0 to exit): ").lower()
+                if status_choice == '0':
+                    return
+                if status_choice in ['q', 'j', 'b']:
+                    break
+                print("Invalid choice. Please enter 'q' for Q, 'j' for Jira, 'b' for Both, or '0' to exit.")
+            
+            try:
+                log_index = int(self.ask(f"\nEnter log number to mark as {label} (0 to exit): ")) - 1
+            except ValueError:
+                print("Invalid input")
+                self.ask("\nPress Enter to continue...")
                 return
-            if status_choice in ['q', 'j', 'b']:
-                break
-            print("Invalid choice. Please enter 'q' for Q, 'j' for Jira, 'b' for Both, or '0' to exit.")
-        
-        try:
-            log_index = int(self.ask("\nEnter log number to mark as unchecked (0 to exit): ")) - 1
-            if log_index == -1:
+            if not 0 <= log_index < len(self.logs):
                 return
             
-            if 0 <= log_index < len(self.logs):
-                if status_choice in ['q', 'b']:
-                    self.logs[log_index]["q_status"] = "❌"
-                if status_choice in ['j', 'b']:
-                    self.logs[log_index]["jira_status"] = "❌"
-                
-                status_updated = []
-                if status_choice in ['q', 'b']:
-                    status_updated.append("Q")
-                if status_choice in ['j', 'b']:
-                    status_updated.append("Jira")
-                
-                print(f"\nMarked log {log_index + 1} as unchecked for {', '.join(status_updated)}.")
-                self.save_logs()
-                
-                # Ask if user wants to mark another log
-                while True:
-                    another = self.ask("\nDo you want to mark another log as unchecked? (y/n): ").lower()
-                    if another == 'y':
-                        self.mark_as_unchecked()
-                        break
-                    elif another == 'n':
-                        break
-                    else:
-                        print("Please enter 'y' or 'n'")
-        except ValueError:
-            print("Invalid input")
-            self.ask("\nPress Enter to continue...")
+            targets = _STATUS_CHOICES[status_choice]
+            log = self.logs[log_index]
+            for field, _ in targets:
+                log[field] = status
+            
+            print(f"\nMarked log {log_index + 1} as {label} for {', '.join(name for _, name in targets)}.")
+            self._logs_dirty = True  # Saved once the user is done marking
+            
+            # Ask if user wants to mark another log
+            while True:
+                another = self.ask(f"\nDo you want to mark another log as {label}? (y/n): ").lower()
+                if another in ['y', 'n']:
+                    break
+                print("Please enter 'y' or 'n'")
+            if another == 'n':
+                return
 
     def mark_all_day_as_checked(self):
         while True:
-            print(self.term.clear)
-            print(self.term.move_y(0) + self.term.black_on_white + "Mark All Day as Checked" + self.term.normal)
+            print(self._clear)
+            print(self._home + self._hdr_on + "Mark All Day as Checked" + self._normal)
 
             while True:
                 status_choice = self.ask("\nWhich status do you want to update? (q/j/b for Q/Jira/Both, 0 to exit): ").lower()
@@ -647,49 +928,43 @@ class BLogger:
 
             # Last 5 dates that have logs (newest first)
             dates_with_logs = sorted(
-                set(log['timestamp'].split()[0] for log in self.logs),
-                key=lambda d: datetime.strptime(d, "%d.%m.%Y"),
+                set(log['timestamp'].partition(' ')[0] for log in self.logs),
+                key=self._parse_date,
                 reverse=True
             )
             last_5_days = dates_with_logs[:5]
             print("\nLast 5 days with logs:")
             for idx, d in enumerate(last_5_days, 1):
                 print(f"  {idx}. {d}")
-                logs_for_day = [log for log in self.logs if log['timestamp'].split()[0] == d]
+                logs_for_day = [log for log in self.logs if log['timestamp'].partition(' ')[0] == d]
                 for log in logs_for_day:
                     hours = f" ({log['hours']})" if log.get('hours') else ""
-                    print(f"      {log['ticket']}{hours}  Q:{log.get('q_status', '❌')} Jira:{log.get('jira_status', '❌')}")
+                    print(f"      {log['ticket']}{hours}  Q:{log.get('q_status', _CROSS)} Jira:{log.get('jira_status', _CROSS)}")
             if not last_5_days:
                 print("  (no logs yet)")
             date_prompt = f"\nEnter date (1-{len(last_5_days)} or DD.MM.YYYY): " if last_5_days else "\nEnter date (DD.MM.YYYY): "
             date_input = self.ask(date_prompt).strip()
-            if last_5_days and date_input in [str(i) for i in range(1, len(last_5_days) + 1)]:
+            if last_5_days and date_input in _DAY_PICKS[:len(last_5_days)]:
                 date_str = last_5_days[int(date_input) - 1]
             else:
                 date_str = date_input
             try:
-                datetime.strptime(date_str, "%d.%m.%Y")
+                self._parse_date(date_str)
             except ValueError:
                 print("Invalid date format. Please use 1-5 or DD.MM.YYYY.")
                 self.ask("\nPress Enter to continue...")
                 continue
 
+            targets = _STATUS_CHOICES[status_choice]
             count = 0
             for log in self.logs:
-                log_date = log['timestamp'].split()[0]
+                log_date = log['timestamp'].partition(' ')[0]
                 if log_date == date_str:
-                    if status_choice in ['q', 'b']:
-                        log["q_status"] = "✅"
-                    if status_choice in ['j', 'b']:
-                        log["jira_status"] = "✅"
+                    for field, _ in targets:
+                        log[field] = _CHECK
                     count += 1
 
-            status_updated = []
-            if status_choice in ['q', 'b']:
-                status_updated.append("Q")
-            if status_choice in ['j', 'b']:
-                status_updated.append("Jira")
-            print(f"\nMarked {count} log(s) as checked for {date_str} ({', '.join(status_updated)}).")
+            print(f"\nMarked {count} log(s) as checked for {date_str} ({', '.join(name for _, name in targets)}).")
             if count > 0:
                 self.save_logs()
 
@@ -703,8 +978,8 @@ class BLogger:
 
     def mark_all_day_as_unchecked(self):
         while True:
-            print(self.term.clear)
-            print(self.term.move_y(0) + self.term.black_on_white + "Mark All Day as Unchecked" + self.term.normal)
+            print(self._clear)
+            print(self._home + self._hdr_on + "Mark All Day as Unchecked" + self._normal)
 
             while True:
                 status_choice = self.ask("\nWhich status do you want to update? (q/j/b for Q/Jira/Both, 0 to exit): ").lower()
@@ -716,49 +991,43 @@ class BLogger:
 
             # Last 5 dates that have logs (newest first)
             dates_with_logs = sorted(
-                set(log['timestamp'].split()[0] for log in self.logs),
-                key=lambda d: datetime.strptime(d, "%d.%m.%Y"),
+                set(log['timestamp'].partition(' ')[0] for log in self.logs),
+                key=self._parse_date,
                 reverse=True
             )
             last_5_days = dates_with_logs[:5]
             print("\nLast 5 days with logs:")
             for idx, d in enumerate(last_5_days, 1):
                 print(f"  {idx}. {d}")
-                logs_for_day = [log for log in self.logs if log['timestamp'].split()[0] == d]
+                logs_for_day = [log for log in self.logs if log['timestamp'].partition(' ')[0] == d]
                 for log in logs_for_day:
                     hours = f" ({log['hours']})" if log.get('hours') else ""
-                    print(f"      {log['ticket']}{hours}  Q:{log.get('q_status', '❌')} Jira:{log.get('jira_status', '❌')}")
+                    print(f"      {log['ticket']}{hours}  Q:{log.get('q_status', _CROSS)} Jira:{log.get('jira_status', _CROSS)}")
             if not last_5_days:
                 print("  (no logs yet)")
             date_prompt = f"\nEnter date (1-{len(last_5_days)} or DD.MM.YYYY): " if last_5_days else "\nEnter date (DD.MM.YYYY): "
             date_input = self.ask(date_prompt).strip()
-            if last_5_days and date_input in [str(i) for i in range(1, len(last_5_days) + 1)]:
+            if last_5_days and date_input in _DAY_PICKS[:len(last_5_days)]:
                 date_str = last_5_days[int(date_input) - 1]
             else:
                 date_str = date_input
             try:
-                datetime.strptime(date_str, "%d.%m.%Y")
+                self._parse_date(date_str)
             except ValueError:
                 print("Invalid date format. Please use 1-5 or DD.MM.YYYY.")
                 self.ask("\nPress Enter to continue...")
                 continue
 
+            targets = _STATUS_CHOICES[status_choice]
             count = 0
             for log in self.logs:
-                log_date = log['timestamp'].split()[0]
+                log_date = log['timestamp'].partition(' ')[0]
                 if log_date == date_str:
-                    if status_choice in ['q', 'b']:
-                        log["q_status"] = "❌"
-                    if status_choice in ['j', 'b']:
-                        log["jira_status"] = "❌"
+                    for field, _ in targets:
+                        log[field] = _CROSS
                     count += 1
 
-            status_updated = []
-            if status_choice in ['q', 'b']:
-                status_updated.append("Q")
-            if status_choice in ['j', 'b']:
-                status_updated.append("Jira")
-            print(f"\nMarked {count} log(s) as unchecked for {date_str} ({', '.join(status_updated)}).")
+            print(f"\nMarked {count} log(s) as unchecked for {date_str} ({', '.join(name for _, name in targets)}).")
             if count > 0:
                 self.save_logs()
 
@@ -771,8 +1040,8 @@ class BLogger:
                 print("Unesi 'y' ili 'n'.")
 
     def edit_subtasks(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Edit Subtasks" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Edit Subtasks" + self._normal)
         self.display_logs()
         try:
             log_index = int(self.ask("\nEnter log number to edit subtasks (0 to exit): ")) - 1
@@ -839,8 +1108,8 @@ class BLogger:
         """Load settings from file or create default settings"""
         default_settings = {
             "log_types": [
-                {"name": "Q", "prefix": "QI-", "status": "❌"},
-                {"name": "Jira", "prefix": "JIRA-", "status": "❌"}
+                {"name": "Q", "prefix": "QI-", "status": _CROSS},
+                {"name": "Jira", "prefix": "JIRA-", "status": _CROSS}
             ],
             "sprint_config": {
                 "start_date": "2025-04-30",
@@ -850,59 +1119,58 @@ class BLogger:
         
         if os.path.exists(self.settings_file):
             try:
-                with open(self.settings_file, 'r') as f:
-                    self.settings = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    self.settings = _json_loads(f.read())
             except json.JSONDecodeError:
                 print("Error loading settings. Using default settings.")
                 self.settings = default_settings
         else:
             self.settings = default_settings
             self.save_settings()
+        self._index_log_types()
+
+    def _index_log_types(self):
+        """Cache (name, status field) pairs for the configured log types."""
+        self._log_type_fields = tuple(
+            (log_type["name"], f"{log_type['name'].lower()}_status")
+            for log_type in self.settings["log_types"]
+        )
 
     def save_settings(self):
         """Save current settings to file"""
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.settings, f, indent=2)
+        _write_atomic(self.settings_file, _json_dumps(self.settings))
+        self._index_log_types()  # Log types may have changed
 
     def manage_settings(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Settings" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Settings" + self._normal)
         
         while True:
-            print("\n1. Manage Log Types")
-            print("2. Configure Sprint Settings")
-            print("3. View Current Settings")
-            print("4. Return to Main Menu")
+            print(_SETTINGS_MENU)
             
-            try:
-                choice = self.ask("\nEnter your choice (1-4): ")
-                
-                if choice == "1":
-                    self.manage_log_types()
-                elif choice == "2":
-                    self.configure_sprint_settings()
-                elif choice == "3":
-                    self.view_settings()
-                elif choice == "4":
-                    break
-                else:
-                    print("Invalid choice. Please enter a number between 1 and 4.")
-            except KeyboardInterrupt:
+            choice = self.ask("\nEnter your choice (1-4): ")
+            
+            if choice == "1":
+                self.manage_log_types()
+            elif choice == "2":
+                self.configure_sprint_settings()
+            elif choice == "3":
+                self.view_settings()
+            elif choice == "4":
                 break
+            else:
+                print("Invalid choice. Please enter a number between 1 and 4.")
 
     def manage_log_types(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Manage Log Types" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Manage Log Types" + self._normal)
         
         while True:
             print("\nCurrent Log Types:")
             for i, log_type in enumerate(self.settings["log_types"], 1):
                 print(f"{i}. {log_type['name']} (Prefix: {log_type['prefix']})")
             
-            print("\n1. Add New Log Type")
-            print("2. Edit Existing Log Type")
-            print("3. Delete Log Type")
-            print("4. Return to Settings")
+            print(_LOG_TYPES_MENU)
             
             try:
                 choice = self.ask("\nEnter your choice (1-4): ")
@@ -913,7 +1181,7 @@ class BLogger:
                     self.settings["log_types"].append({
                         "name": name,
                         "prefix": prefix,
-                        "status": "❌"
+                        "status": _CROSS
                     })
                     self.save_settings()
                     print("Log type added successfully!")
@@ -959,63 +1227,55 @@ class BLogger:
             
             except (ValueError, IndexError):
                 print("Invalid input. Please enter a valid number.")
-            except KeyboardInterrupt:
-                break
 
     def configure_sprint_settings(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Configure Sprint Settings" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Configure Sprint Settings" + self._normal)
         
         while True:
             print("\nCurrent Sprint Settings:")
             print(f"Start Date: {self.settings['sprint_config']['start_date']}")
             print(f"Duration: {self.settings['sprint_config']['duration_weeks']} weeks")
             
-            print("\n1. Change Sprint Start Date")
-            print("2. Change Sprint Duration")
-            print("3. Return to Settings")
+            print(_SPRINT_MENU)
             
-            try:
-                choice = self.ask("\nEnter your choice (1-3): ")
-                
-                if choice == "1":
-                    while True:
-                        new_date = self.ask("Enter new start date (YYYY-MM-DD): ")
-                        try:
-                            datetime.strptime(new_date, "%Y-%m-%d")
-                            self.settings["sprint_config"]["start_date"] = new_date
+            choice = self.ask("\nEnter your choice (1-3): ")
+            
+            if choice == "1":
+                while True:
+                    new_date = self.ask("Enter new start date (YYYY-MM-DD): ")
+                    try:
+                        _parse_ymd(new_date)
+                        self.settings["sprint_config"]["start_date"] = new_date
+                        self.save_settings()
+                        print("Sprint start date updated successfully!")
+                        break
+                    except ValueError:
+                        print("Invalid date format. Please use YYYY-MM-DD.")
+            
+            elif choice == "2":
+                while True:
+                    try:
+                        new_duration = int(self.ask("Enter new sprint duration in weeks: "))
+                        if new_duration > 0:
+                            self.settings["sprint_config"]["duration_weeks"] = new_duration
                             self.save_settings()
-                            print("Sprint start date updated successfully!")
+                            print("Sprint duration updated successfully!")
                             break
-                        except ValueError:
-                            print("Invalid date format. Please use YYYY-MM-DD.")
-                
-                elif choice == "2":
-                    while True:
-                        try:
-                            new_duration = int(self.ask("Enter new sprint duration in weeks: "))
-                            if new_duration > 0:
-                                self.settings["sprint_config"]["duration_weeks"] = new_duration
-                                self.save_settings()
-                                print("Sprint duration updated successfully!")
-                                break
-                            else:
-                                print("Duration must be greater than 0.")
-                        except ValueError:
-                            print("Please enter a valid number.")
-                
-                elif choice == "3":
-                    break
-                
-                else:
-                    print("Invalid choice. Please enter a number between 1 and 3.")
+                        else:
+                            print("Duration must be greater than 0.")
+                    except ValueError:
+                        print("Please enter a valid number.")
             
-            except KeyboardInterrupt:
+            elif choice == "3":
                 break
+            
+            else:
+                print("Invalid choice. Please enter a number between 1 and 3.")
 
     def view_settings(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Current Settings" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Current Settings" + self._normal)
         
         print("\nLog Types:")
         for log_type in self.settings["log_types"]:
@@ -1027,95 +1287,103 @@ class BLogger:
         
         self.ask("\nPress Enter to continue...")
 
+    def _sprint_config(self):
+        """(first sprint start, sprint length in days) from the settings."""
+        config = self.settings["sprint_config"]
+        return _parse_ymd(config["start_date"]), config["duration_weeks"] * 7
+
     def get_sprint_dates(self, sprint_number=None):
         """Get start and end dates for a specific sprint number or current sprint"""
-        # Get sprint configuration from settings
-        first_sprint_start = datetime.strptime(self.settings["sprint_config"]["start_date"], "%Y-%m-%d")
-        sprint_duration = self.settings["sprint_config"]["duration_weeks"] * 7  # Convert weeks to days
+        first_sprint_start, sprint_duration = self._sprint_config()
         
         if sprint_number is None:
             # Calculate current sprint based on current date
-            now = datetime.now()
-            days_since_first_sprint = (now - first_sprint_start).days
-            sprint_number = days_since_first_sprint // sprint_duration
+            sprint_number = _sprint_index(datetime.now(), first_sprint_start, sprint_duration)
         
-        # Calculate sprint dates based on sprint number
-        sprint_start = first_sprint_start + timedelta(days=sprint_duration * sprint_number)
-        sprint_end = sprint_start + timedelta(days=sprint_duration - 1)  # Sprint ends one day before next sprint
-        
-        return sprint_start, sprint_end
+        return _sprint_dates(first_sprint_start, sprint_duration, sprint_number)
 
     def view_sprint_history(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Sprint History" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Sprint History" + self._normal)
         
         if not self.logs:
             print("\nNo logs found.")
             self.ask("\nPress Enter to continue...")
             return
             
-        # Find the earliest and latest log dates
-        log_dates = [datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y") for log in self.logs]
-        earliest_date = min(log_dates)
-        latest_date = max(log_dates)
-        
-        # Calculate sprint numbers
-        first_sprint_start = datetime(2025, 4, 30)
-        days_since_first_sprint = (earliest_date - first_sprint_start).days
-        sprints_back = abs(days_since_first_sprint // 14)  # How many sprints before April 30, 2025
-        
-        days_since_first_sprint = (latest_date - first_sprint_start).days
-        sprints_forward = days_since_first_sprint // 14  # How many sprints after April 30, 2025
+        # Bucket logs by sprint number in one pass
+        sprint_origin, sprint_duration = self._sprint_config()
+        sprint_buckets = {}
+        for log in self.logs:
+            number = _sprint_index(self._date_key(log), sprint_origin, sprint_duration)
+            sprint_buckets.setdefault(number, []).append(log)
         
+        # Logs are sorted, so buckets were created in sprint order: first/last span the history
+        sprint_numbers = list(sprint_buckets)
+        now = datetime.now()
+        # Collect the whole history and write it in one go
+        lines = []
         # Show sprints from earliest to latest with logs
-        for i in range(-sprints_back, sprints_forward + 1):
+        for i in range(sprint_numbers[0], sprint_numbers[-1] + 1):
             sprint_start, sprint_end = self.get_sprint_dates(i)
-            
-            # Filter logs within sprint period
-            sprint_logs = []
-            for log in self.logs:
-                log_date = datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y")
-                if sprint_start <= log_date <= sprint_end:
-                    sprint_logs.append(log)
+            sprint_logs = sprint_buckets.get(i, [])
             
             # Show sprint if it has logs or is in the past
-            if sprint_logs or sprint_end < datetime.now():
-                print(f"\nSprint Period: {sprint_start.strftime('%d.%m.%Y')} - {sprint_end.strftime('%d.%m.%Y')}")
+            if sprint_logs or sprint_end < now:
+                lines.append(f"\nSprint Period: {sprint_start.strftime('%d.%m.%Y')} - {sprint_end.strftime('%d.%m.%Y')}")
                 
                 if sprint_logs:
-                    # Sort logs by date
-                    sprint_logs.sort(key=lambda x: datetime.strptime(x['timestamp'].split()[0], "%d.%m.%Y"))
-                    
-                    # Group logs by date
-                    current_date = None
-                    for log in sprint_logs:
-                        log_date = log['timestamp'].split()[0]
-                        if current_date != log_date:
-                            current_date = log_date
-                            print(f"\n  {self.term.yellow(current_date)}")
-                        print(f"    {self.term.cyan(log['ticket'])}")
+                    # Already in date order: bucketed from the sorted self.logs
+                    lines.extend(self._ticket_lines(sprint_logs))
                 else:
-                    print("  No logs found for this sprint")
+                    lines.append("  No logs found for this sprint")
                 
-                print("-" * 72)
+                lines.append(_SEP)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
         
         self.ask("\nPress Enter to continue...")
 
+    def _ticket_lines(self, logs):
+        """Lines listing the tickets of date-ordered logs under a heading per day."""
+        lines = []
+        for log_date, day_logs in groupby(logs, key=lambda log: log['timestamp'].partition(' ')[0]):
+            lines.append(f"\n  {self._yellow}{log_date}{self._normal}")
+            lines.extend(f"    {self._cyan}{log['ticket']}{self._normal}" for log in day_logs)
+        return lines
+
+    def _print_tickets_by_day(self, logs):
+        """Print the tickets of date-ordered logs under a heading per day."""
+        sys.stdout.write("\n".join(self._ticket_lines(logs)) + "\n")
+
+    @staticmethod
+    def _distinct_qi_tickets(logs):
+        """Map each QI number to one ticket, preferring the one marked [Q]."""
+        qi_logs = {}  # Use dict to store unique QI numbers
+        for log in logs:
+            ticket = log['ticket']
+            if not ticket.startswith('QI-'):
+                continue
+            # Extract QI number (everything before the first space or [)
+            qi_number = ticket.split(None, 1)[0].partition('[')[0]
+            # Keep the version with [Q] if it exists, otherwise keep the first one
+            if '[Q]' in ticket:
+                qi_logs[qi_number] = ticket
+            else:
+                qi_logs.setdefault(qi_number, ticket)
+        return qi_logs
+
     def view_sprint_logs(self):
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Current Sprint Logs" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Current Sprint Logs" + self._normal)
         
         # Get current sprint dates (pass None to get current sprint)
         sprint_start, sprint_end = self.get_sprint_dates(None)
         print(f"\nSprint Period: {sprint_start.strftime('%d.%m.%Y')} - {sprint_end.strftime('%d.%m.%Y')}")
-        print("-" * 72)
+        print(_SEP)
         
         # Filter logs within sprint period
-        sprint_logs = []
-        for log in self.logs:
-            log_date = datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y")
-            if sprint_start <= log_date <= sprint_end:
-                sprint_logs.append(log)
+        sprint_logs = self._logs_between(sprint_start, sprint_end)
         
         if not sprint_logs:
             print("\nNo logs found for the current sprint.")
@@ -1123,42 +1391,26 @@ class BLogger:
             return
         
         # Get distinct QI- logs
-        qi_logs = {}  # Use dict to store unique QI numbers
-        for log in sprint_logs:
-            if log['ticket'].startswith('QI-'):
-                # Extract QI number (everything before the first space or [)
-                qi_number = log['ticket'].split()[0].split('[')[0]
-                # Keep the version with [Q] if it exists, otherwise keep the first one
-                if '[Q]' in log['ticket'] or qi_number not in qi_logs:
-                    qi_logs[qi_number] = log['ticket']
+        qi_logs = self._distinct_qi_tickets(sprint_logs)
         
         # Display QI logs first
         if qi_logs:
-            print("\nQI Tickets:")
-            for qi_log in sorted(qi_logs.values()):
-                print(f"  {self.term.cyan(qi_log)}")
-            print("-" * 72)
+            lines = ["\nQI Tickets:"]
+            lines.extend(f"  {self._cyan}{qi_log}{self._normal}" for qi_log in sorted(qi_logs.values()))
+            lines.append(_SEP)
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Display all logs sorted by date
         print("\nOther Logs:")
-        # Sort logs by date
-        sprint_logs.sort(key=lambda x: datetime.strptime(x['timestamp'].split()[0], "%d.%m.%Y"))
-        
-        # Group logs by date
-        current_date = None
-        for log in sprint_logs:
-            log_date = log['timestamp'].split()[0]
-            if current_date != log_date:
-                current_date = log_date
-                print(f"\n  {self.term.yellow(current_date)}")
-            print(f"    {self.term.cyan(log['ticket'])}")
+        # Already in date order: filtered from the sorted self.logs
+        self._print_tickets_by_day(sprint_logs)
         
         self.ask("\nPress Enter to continue...")
 
     def display_statistics(self):
         """Display statistics and charts for logs in the last 10 workdays"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Statistics and Charts" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Statistics and Charts" + self._normal)
         
         if not self.logs:
             print("\nNo logs found.")
@@ -1170,11 +1422,7 @@ class BLogger:
         fourteen_days_ago = current_date - timedelta(days=13)
         
         # First, get all logs from the last 14 days
-        recent_logs = []
-        for log in self.logs:
-            log_date = datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y")
-            if log_date >= fourteen_days_ago:
-                recent_logs.append(log)
+        recent_logs = self.logs[self._bisect_logs(fourteen_days_ago):]
         
         if not recent_logs:
             print("\nNo logs found in the last 10 workdays.")
@@ -1182,119 +1430,143 @@ class BLogger:
             return
         
         # Get unique workdays from the logs
-        workdays = set()
+        workday_dates = set()
         for log in recent_logs:
-            log_date = datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y")
+            log_date = self._date_key(log)
             if log_date.weekday() < 5:  # 0-4 are weekdays
-                workdays.add(log_date.strftime("%d.%m.%Y"))
+                workday_dates.add(log_date)
         
-        # Sort workdays and take the last 10
-        workdays = sorted(list(workdays), key=lambda x: datetime.strptime(x, "%d.%m.%Y"), reverse=True)[:10]
+        # Take the last 10 workdays (newest first) without sorting them all
+        workdays = [day.strftime("%d.%m.%Y") for day in heapq.nlargest(10, workday_dates)]
         
         # Filter logs to only include those from the last 10 workdays
-        recent_logs = [log for log in recent_logs if log['timestamp'].split()[0] in workdays]
+        workday_set = set(workdays)
+        recent_logs = [log for log in recent_logs if log['timestamp'].partition(' ')[0] in workday_set]
         
         # Calculate statistics
         total_logs = len(recent_logs)
         
-        # Calculate completion status for each log type
+        # Per-day hours/counts and completed/incomplete logs per type, in a single pass
+        log_type_fields = self._log_type_fields
+        status_fields = [status_field for _, status_field in log_type_fields]
+        completed_by_type = [0] * len(status_fields)
+        incomplete_by_type = [[] for _ in status_fields]
+        hours_per_day = defaultdict(int)  # Minutes, kept integral for format_hours
+        logs_by_date = Counter()
+        max_hours = max_logs = 0  # Chart scales; per-day totals only grow, so track as we go
+        parse_hours = self.parse_hours
+        for log in recent_logs:
+            date = log['timestamp'].partition(' ')[0]
+            day_minutes = hours_per_day[date] = hours_per_day[date] + parse_hours(log['hours'])
+            if day_minutes > max_hours:
+                max_hours = day_minutes
+            day_logs = logs_by_date[date] = logs_by_date[date] + 1
+            if day_logs > max_logs:
+                max_logs = day_logs
+            for i, status_field in enumerate(status_fields):
+                status = log.get(status_field, _CROSS)
+                if status == _CHECK:
+                    completed_by_type[i] += 1
+                elif status == _CROSS:
+                    incomplete_by_type[i].append(log)
+        
+        # Completion status for each log type
         completion_stats = {}
-        for log_type in self.settings["log_types"]:
-            type_name = log_type["name"]
-            status_field = f"{type_name.lower()}_status"
-            completed = sum(1 for log in recent_logs if log.get(status_field, "❌") == "✅")
+        for (type_name, _), completed in zip(log_type_fields, completed_by_type):
             completion_stats[type_name] = {
                 "completed": completed,
                 "total": total_logs,
                 "percentage": (completed/total_logs*100) if total_logs > 0 else 0
             }
         
-        # Calculate hours per day
-        hours_per_day = {}
-        for log in recent_logs:
-            date = log['timestamp'].split()[0]
-            if date not in hours_per_day:
-                hours_per_day[date] = 0
-            hours_per_day[date] += self.parse_hours(log['hours'])
-        
-        # Display statistics
-        print("\n" + self.term.underline + "Summary Statistics (Last 10 Workdays):" + self.term.normal)
-        print(f"Total Logs: {total_logs}")
+        # Display statistics, collected and written in one go
+        lines = []
+        append = lines.append
+        append("\n" + self._underline + "Summary Statistics (Last 10 Workdays):" + self._normal)
+        append(f"Total Logs: {total_logs}")
         for type_name, stats in completion_stats.items():
-            print(f"Completed {type_name} Logs: {stats['completed']} ({stats['percentage']:.1f}%)")
+            append(f"Completed {type_name} Logs: {stats['completed']} ({stats['percentage']:.1f}%)")
         
         # Display incomplete logs for each type
-        for log_type in self.settings["log_types"]:
-            type_name = log_type["name"]
-            status_field = f"{type_name.lower()}_status"
-            print(f"\n" + self.term.underline + f"Incomplete {type_name} Logs:" + self.term.normal)
-            incomplete_logs = [log for log in recent_logs if log.get(status_field, "❌") == "❌"]
+        for (type_name, _), incomplete_logs in zip(log_type_fields, incomplete_by_type):
+            append(f"\n" + self._underline + f"Incomplete {type_name} Logs:" + self._normal)
             if incomplete_logs:
-                for log in sorted(incomplete_logs, key=lambda x: datetime.strptime(x['timestamp'].split()[0], "%d.%m.%Y")):
-                    print(f"{log['timestamp'].split()[0]}: {log['ticket']}")
+                for log in incomplete_logs:  # Already in date order, like recent_logs
+                    append(f"{log['timestamp'].partition(' ')[0]}: {log['ticket']}")
             else:
-                print(f"No incomplete {type_name} logs found.")
+                append(f"No incomplete {type_name} logs found.")
         
         # Display hours chart
-        print("\n" + self.term.underline + "Hours per Workday:" + self.term.normal)
-        max_hours = max(hours_per_day.values()) if hours_per_day else 0
-        chart_width = 50  # Maximum width of the chart
+        append("\n" + self._underline + "Hours per Workday:" + self._normal)
+        # Bars are scaled in integer arithmetic; an all-zero chart divides by 1 instead of 0
+        hours_scale = max_hours or 1
+        logs_scale = max_logs or 1
         
         # Display hours for each workday
+        today_str = current_date.strftime("%d.%m.%Y")
         for date in workdays:
             hours = hours_per_day.get(date, 0)
-            bar_length = int((hours / max_hours) * chart_width) if max_hours > 0 else 0
-            bar = "█" * bar_length
+            bar = _BAR[:hours * _CHART_WIDTH // hours_scale]
             hours_str = self.format_hours(hours)
             # Add a star (*) to indicate today's date
-            if date == current_date.strftime("%d.%m.%Y"):
-                print(f"{date}*: {bar} {hours_str}")
+            if date == today_str:
+                append(f"{date}*: {bar} {hours_str}")
             else:
-                print(f"{date}: {bar} {hours_str}")
+                append(f"{date}: {bar} {hours_str}")
         
         # Display logs per workday chart
-        print("\n" + self.term.underline + "Logs per Workday:" + self.term.normal)
-        logs_by_date = {}
-        for log in recent_logs:
-            date = log['timestamp'].split()[0]
-            if date not in logs_by_date:
-                logs_by_date[date] = 0
-            logs_by_date[date] += 1
-        
-        max_logs = max(logs_by_date.values()) if logs_by_date else 0
-        
+        append("\n" + self._underline + "Logs per Workday:" + self._normal)
         # Display logs for each workday
         for date in workdays:
             num_logs = logs_by_date.get(date, 0)
-            bar_length = int((num_logs / max_logs) * chart_width) if max_logs > 0 else 0
-            bar = "█" * bar_length
+            bar = _BAR[:num_logs * _CHART_WIDTH // logs_scale]
             # Add a star (*) to indicate today's date
-            if date == current_date.strftime("%d.%m.%Y"):
-                print(f"{date}*: {bar} {num_logs} logs")
+            if date == today_str:
+                append(f"{date}*: {bar} {num_logs} logs")
             else:
-                print(f"{date}: {bar} {num_logs} logs")
+                append(f"{date}: {bar} {num_logs} logs")
         
-        print("\n* Today's date")
+        append("\n* Today's date")
+        sys.stdout.write("\n".join(lines) + "\n")
         self.ask("\nPress Enter to continue...")
 
     def load_scripts(self):
-        """Load migration scripts from file"""
+        """Read and return the migration scripts, creating an empty scripts.json on first run"""
         if os.path.exists(self.scripts_file):
-            with open(self.scripts_file, 'r') as f:
-                self.scripts = json.load(f)
-        else:
-            self.scripts = []
-            self.save_scripts()
+            with open(self.scripts_file, 'rb') as f:
+                return _json_loads(f.read())
+        # Called while the scripts property resolves, so write the new list directly
+        scripts = []
+        _write_atomic(self.scripts_file, _json_dumps(scripts))
+        return scripts
 
     def save_scripts(self):
         """Save migration scripts to file"""
-        with open(self.scripts_file, 'w') as f:
-            json.dump(self.scripts, f, indent=2)
+        self._scripts_text = None  # Scripts changed: re-render the listing next time
+        _write_atomic(self.scripts_file, _json_dumps(self.scripts))
+
+    def _scripts_listing(self):
+        """Rendered list of all migration scripts, rebuilt only after they change."""
+        if self._scripts_text is None:
+            lines = ["\nMigration Scripts:", _SEP]
+            append = lines.append
+            for i, script in enumerate(self.scripts, 1):
+                append(f"\n{i}. Ticket: {script['ticket']}")
+                append(f"   Timestamp: {script['timestamp']}")
+                append(f"   Script:")
+                # Display script with proper indentation
+                lines.extend(f"      {line}" for line in script['script'].split('\n'))
+                append(f"   Demo: {script.get('demo_status', _CROSS)}")
+                append(f"   Stage: {script.get('stage_status', _CROSS)}")
+                append(f"   Release Notes: {script.get('release_status', _CROSS)}")
+                append(_SEP)
+            self._scripts_text = "\n".join(lines) + "\n"
+        return self._scripts_text
 
     def log_migration_script(self):
         """Log a new migration script"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Log Migration Script" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Log Migration Script" + self._normal)
         
         ticket = self.ask("\nEnter ticket: ").strip()
         if not ticket or ticket.lower() in ['0', 'exit']:
@@ -1319,26 +1591,8 @@ class BLogger:
             self.ask("\nPress Enter to continue...")
             return
         
-        # Get status for Demo
-        while True:
-            demo_status = self.ask("Update Demo status (x for ❌, c for ✅): ").lower()
-            if demo_status in ['x', 'c']:
-                break
-            print("Invalid choice. Please enter 'x' for ❌ or 'c' for ✅")
-        
-        # Get status for Stage
-        while True:
-            stage_status = self.ask("Update Stage status (x for ❌, c for ✅): ").lower()
-            if stage_status in ['x', 'c']:
-                break
-            print("Invalid choice. Please enter 'x' for ❌ or 'c' for ✅")
-        
-        # Get status for Release notes
-        while True:
-            release_status = self.ask("Update Release notes status (x for ❌, c for ✅): ").lower()
-            if release_status in ['x', 'c']:
-                break
-            print("Invalid choice. Please enter 'x' for ❌ or 'c' for ✅")
+        # Get status for Demo, Stage and Release notes
+        statuses = {field: self._prompt_status(label) for field, label in _SCRIPT_STATUSES}
         
         current_time = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
         
@@ -1346,9 +1600,7 @@ class BLogger:
             "timestamp": current_time,
             "ticket": ticket,
             "script": script,
-            "demo_status": "✅" if demo_status == "c" else "❌",
-            "stage_status": "✅" if stage_status == "c" else "❌",
-            "release_status": "✅" if release_status == "c" else "❌"
+            **statuses
         }
         
         self.scripts.append(new_script)
@@ -1356,56 +1608,42 @@ class BLogger:
         print("\nMigration script logged successfully!")
         self.ask("\nPress Enter to continue...")
 
+    def _prompt_status(self, label, keep=False):
+        """Ask for an x/c status until valid; with keep=True, Enter returns None."""
+        prompt = f"Update {label} status (x for {_CROSS}, c for {_CHECK}{', Enter to keep current' if keep else ''}): "
+        while True:
+            choice = self.ask(prompt).lower()
+            if keep and not choice:
+                return None
+            if choice in ('x', 'c'):
+                return _CHECK if choice == "c" else _CROSS
+            print(f"Invalid choice. Please enter 'x' for {_CROSS} or 'c' for {_CHECK}")
+
     def view_migration_scripts(self):
         """View all migration scripts"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Migration Scripts" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Migration Scripts" + self._normal)
         
         if not self.scripts:
             print("\nNo migration scripts found.")
             self.ask("\nPress Enter to continue...")
             return
         
-        print("\nMigration Scripts:")
-        print("-" * 72)
-        for i, script in enumerate(self.scripts, 1):
-            print(f"\n{i}. Ticket: {script['ticket']}")
-            print(f"   Timestamp: {script['timestamp']}")
-            print(f"   Script:")
-            # Display script with proper indentation
-            script_lines = script['script'].split('\n')
-            for line in script_lines:
-                print(f"      {line}")
-            print(f"   Demo: {script.get('demo_status', '❌')}")
-            print(f"   Stage: {script.get('stage_status', '❌')}")
-            print(f"   Release Notes: {script.get('release_status', '❌')}")
-            print("-" * 72)
+        sys.stdout.write(self._scripts_listing())
         
         self.ask("\nPress Enter to continue...")
 
     def edit_migration_script(self):
         """Edit an existing migration script"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Edit Migration Script" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Edit Migration Script" + self._normal)
         
         if not self.scripts:
             print("\nNo migration scripts found.")
             self.ask("\nPress Enter to continue...")
             return
         
-        print("\nMigration Scripts:")
-        print("-" * 72)
-        for i, script in enumerate(self.scripts, 1):
-            print(f"\n{i}. Ticket: {script['ticket']}")
-            print(f"   Timestamp: {script['timestamp']}")
-            print(f"   Script:")
-            script_lines = script['script'].split('\n')
-            for line in script_lines:
-                print(f"      {line}")
-            print(f"   Demo: {script.get('demo_status', '❌')}")
-            print(f"   Stage: {script.get('stage_status', '❌')}")
-            print(f"   Release Notes: {script.get('release_status', '❌')}")
-            print("-" * 72)
+        sys.stdout.write(self._scripts_listing())
         
         try:
             script_index = int(self.ask("\nEnter script number to edit (0 to exit): ")) - 1
@@ -1447,38 +1685,12 @@ class BLogger:
                     else:
                         print("Script cannot be empty, keeping current script.")
                 
-                # Edit Demo status
-                print(f"\nCurrent Demo status: {script.get('demo_status', '❌')}")
-                while True:
-                    demo_status = self.ask("Update Demo status (x for ❌, c for ✅, Enter to keep current): ").lower()
-                    if not demo_status:
-                        break
-                    if demo_status in ['x', 'c']:
-                        script['demo_status'] = "✅" if demo_status == "c" else "❌"
-                        break
-                    print("Invalid choice. Please enter 'x' for ❌ or 'c' for ✅")
-                
-                # Edit Stage status
-                print(f"\nCurrent Stage status: {script.get('stage_status', '❌')}")
-                while True:
-                    stage_status = self.ask("Update Stage status (x for ❌, c for ✅, Enter to keep current): ").lower()
-                    if not stage_status:
-                        break
-                    if stage_status in ['x', 'c']:
-                        script['stage_status'] = "✅" if stage_status == "c" else "❌"
-                        break
-                    print("Invalid choice. Please enter 'x' for ❌ or 'c' for ✅")
-                
-                # Edit Release notes status
-                print(f"\nCurrent Release notes status: {script.get('release_status', '❌')}")
-                while True:
-                    release_status = self.ask("Update Release notes status (x for ❌, c for ✅, Enter to keep current): ").lower()
-                    if not release_status:
-                        break
-                    if release_status in ['x', 'c']:
-                        script['release_status'] = "✅" if release_status == "c" else "❌"
-                        break
-                    print("Invalid choice. Please enter 'x' for ❌ or 'c' for ✅")
+                # Edit Demo, Stage and Release notes status
+                for field, label in _SCRIPT_STATUSES:
+                    print(f"\nCurrent {label} status: {script.get(field, _CROSS)}")
+                    status = self._prompt_status(label, keep=True)
+                    if status:
+                        script[field] = status
                 
                 self.scripts[script_index] = script
                 self.save_scripts()
@@ -1490,28 +1702,15 @@ class BLogger:
 
     def delete_migration_script(self):
         """Delete a migration script"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Delete Migration Script" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Delete Migration Script" + self._normal)
         
         if not self.scripts:
             print("\nNo migration scripts found.")
             self.ask("\nPress Enter to continue...")
             return
         
-        print("\nMigration Scripts:")
-        print("-" * 72)
-        for i, script in enumerate(self.scripts, 1):
-            print(f"\n{i}. Ticket: {script['ticket']}")
-            print(f"   Timestamp: {script['timestamp']}")
-            print(f"   Script:")
-            # Display script with proper indentation
-            script_lines = script['script'].split('\n')
-            for line in script_lines:
-                print(f"      {line}")
-            print(f"   Demo: {script.get('demo_status', '❌')}")
-            print(f"   Stage: {script.get('stage_status', '❌')}")
-            print(f"   Release Notes: {script.get('release_status', '❌')}")
-            print("-" * 72)
+        sys.stdout.write(self._scripts_listing())
         
         try:
             script_index = int(self.ask("\nEnter script number to delete (0 to exit): ")) - 1
@@ -1530,27 +1729,41 @@ class BLogger:
             self.ask("\nPress Enter to continue...")
 
     def load_links(self):
+        """Read and return the saved links (none if links.json does not exist yet)"""
         try:
-            links_file = os.path.join(self.script_dir, "links.json")
-            with open(links_file, 'r') as f:
-                return json.load(f)
+            with open(self.links_file, 'rb') as f:
+                return _json_loads(f.read())
         except FileNotFoundError:
             return {"links": []}
 
+    def _links_listing(self):
+        """Rendered list of all links, rebuilt only after they change."""
+        if self._links_text is None:
+            lines = ["\nLinks:", _SEP]
+            append = lines.append
+            for i, link in enumerate(self.links["links"], 1):
+                append(f"{i}. created: {link['timestamp']}")
+                append(f"   link: @{link['link']}")
+                if link['comments']:
+                    append(f"   Comments: {link['comments']}")
+                append(_SEP)
+            self._links_text = "\n".join(lines) + "\n"
+        return self._links_text
+
     def save_links(self):
+        self._links_text = None  # Links changed: re-render the listing next time
+        # links.json keeps its 4-space layout, which orjson cannot produce
+        data = json.dumps(self.links, indent=4, ensure_ascii=False).encode("utf-8")
+
         # Save to main links file
-        links_file = os.path.join(self.script_dir, "links.json")
-        with open(links_file, 'w') as f:
-            json.dump(self.links, f, indent=4)
+        _write_atomic(self.links_file, data)
             
         # Save to backup file
-        backup_file = os.path.join(self.script_dir, "backup", "links_backup.json")
-        with open(backup_file, 'w') as f:
-            json.dump(self.links, f, indent=4)
+        _write_atomic(self.links_backup_file, data)
 
     def add_link(self):
-        print(self.term.clear)
-        print(self.term.black_on_white + "Add Important Link" + self.term.normal)
+        print(self._clear)
+        print(self._hdr_on + "Add Important Link" + self._normal)
         
         link = self.ask("\nEnter the link: ").strip()
         if not link:
@@ -1573,28 +1786,21 @@ class BLogger:
         self.ask("\nPress Enter to continue...")
 
     def view_links(self):
-        print(self.term.clear)
-        print(self.term.black_on_white + "Important Links" + self.term.normal)
+        print(self._clear)
+        print(self._hdr_on + "Important Links" + self._normal)
         
         if not self.links["links"]:
             print("\nNo links found!")
             self.ask("\nPress Enter to continue...")
             return
         
-        print("\nLinks:")
-        print("-" * 72)
-        for i, link in enumerate(self.links["links"], 1):
-            print(f"{i}. created: {link['timestamp']}")
-            print(f"   link: @{link['link']}")
-            if link['comments']:
-                print(f"   Comments: {link['comments']}")
-            print("-" * 72)
+        sys.stdout.write(self._links_listing())
         
         self.ask("\nPress Enter to continue...")
 
     def edit_link(self):
-        print(self.term.clear)
-        print(self.term.black_on_white + "Edit Important Link" + self.term.normal)
+        print(self._clear)
+        print(self._hdr_on + "Edit Important Link" + self._normal)
         
         if not self.links["links"]:
             print("\nNo links found!")
@@ -1634,8 +1840,8 @@ class BLogger:
         self.ask("\nPress Enter to continue...")
 
     def delete_link(self):
-        print(self.term.clear)
-        print(self.term.black_on_white + "Delete Important Link" + self.term.normal)
+        print(self._clear)
+        print(self._hdr_on + "Delete Important Link" + self._normal)
         
         if not self.links["links"]:
             print("\nNo links found!")
@@ -1664,33 +1870,33 @@ class BLogger:
         self.ask("\nPress Enter to continue...")
 
     def view_logs_for_date(self):
-        print(self.term.clear)
-        print(self.term.black_on_white + "View Logs for a Date" + self.term.normal)
-
-        # Last 5 dates that have logs (newest first)
-        dates_with_logs = sorted(
-            set(log['timestamp'].split()[0] for log in self.logs),
-            key=lambda d: datetime.strptime(d, "%d.%m.%Y"),
-            reverse=True
-        )
-        last_5_days = dates_with_logs[:5]
+        print(self._clear)
+        print(self._hdr_on + "View Logs for a Date" + self._normal)
+
+        # Last 5 dates that have logs (newest first): walk back from the end of the sorted logs
+        last_5_days = []
+        for log in reversed(self.logs):
+            d = log['timestamp'].partition(' ')[0]
+            if d not in last_5_days:
+                if len(last_5_days) == 5:
+                    break
+                last_5_days.append(d)
         print("\nLast 5 days with logs:")
         for idx, d in enumerate(last_5_days, 1):
             print(f"  {idx}. {d}")
-            logs_for_day = [log for log in self.logs if log['timestamp'].split()[0] == d]
-            for log in logs_for_day:
+            for log in self._logs_on(d):
                 hours = f" ({log['hours']})" if log.get('hours') else ""
-                print(f"      {log['ticket']}{hours}  Q:{log.get('q_status', '❌')} Jira:{log.get('jira_status', '❌')}")
+                print(f"      {log['ticket']}{hours}  Q:{log.get('q_status', _CROSS)} Jira:{log.get('jira_status', _CROSS)}")
         if not last_5_days:
             print("  (no logs yet)")
         date_prompt = f"\nEnter date (1-{len(last_5_days)} or DD.MM.YYYY): " if last_5_days else "\nEnter date (DD.MM.YYYY): "
         date_input = self.ask(date_prompt).strip()
-        if last_5_days and date_input in [str(i) for i in range(1, len(last_5_days) + 1)]:
+        if last_5_days and date_input in _DAY_PICKS[:len(last_5_days)]:
             date_str = last_5_days[int(date_input) - 1]
         else:
             date_str = date_input
         try:
-            datetime.strptime(date_str, "%d.%m.%Y")
+            self._parse_date(date_str)
         except ValueError:
             print("Invalid date format. Please use 1-5 or DD.MM.YYYY.")
             self.ask("\nPress Enter to continue...")
@@ -1698,20 +1904,18 @@ class BLogger:
 
         found = False
         output_lines = []
-        for log in self.logs:
-            log_date = log['timestamp'].split()[0]
-            if log_date == date_str:
-                if not found:
-                    output_lines.append(date_str)
-                    found = True
-                # Main log line
-                ticket_line = log['ticket']
-                if log['hours']:
-                    ticket_line += f" ({log['hours']})"
-                output_lines.append(ticket_line)
-                # Subtasks
-                for sub in log.get('subtasks', []):
-                    output_lines.append(f"   └─ {sub}")
+        for log in self._logs_on(date_str):
+            if not found:
+                output_lines.append(date_str)
+                found = True
+            # Main log line
+            ticket_line = log['ticket']
+            if log['hours']:
+                ticket_line += f" ({log['hours']})"
+            output_lines.append(ticket_line)
+            # Subtasks
+            for sub in log.get('subtasks', []):
+                output_lines.append(f"   └─ {sub}")
         if not found:
             print(f"\nNo logs found for {date_str}.")
         else:
@@ -1720,48 +1924,36 @@ class BLogger:
 
     def list_available_sprints(self):
         """List all available sprints with their dates and let user choose"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + "Available Sprints" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + "Available Sprints" + self._normal)
         
         if not self.logs:
             print("\nNo logs found.")
             self.ask("\nPress Enter to continue...")
             return None
             
-        # Find the earliest and latest log dates
-        log_dates = [datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y") for log in self.logs]
-        earliest_date = min(log_dates)
-        latest_date = max(log_dates)
-        
-        # Calculate sprint numbers
-        first_sprint_start = datetime.strptime(self.settings["sprint_config"]["start_date"], "%Y-%m-%d")
-        sprint_duration = self.settings["sprint_config"]["duration_weeks"] * 7
-        
-        days_since_first_sprint = (earliest_date - first_sprint_start).days
-        sprints_back = abs(days_since_first_sprint // sprint_duration)
-        
-        days_since_first_sprint = (latest_date - first_sprint_start).days
-        sprints_forward = days_since_first_sprint // sprint_duration
+        # self.logs is sorted by date, so the ends hold the earliest and latest;
+        # like view_sprint_history, span the sprints containing them
+        first_sprint_start, sprint_duration = self._sprint_config()
+        first_sprint = _sprint_index(self._date_key(self.logs[0]), first_sprint_start, sprint_duration)
+        last_sprint = _sprint_index(self._date_key(self.logs[-1]), first_sprint_start, sprint_duration)
         
         # Show sprints from earliest to latest
         available_sprints = []
-        for i in range(-sprints_back, sprints_forward + 1):
+        now = datetime.now()
+        for i in range(first_sprint, last_sprint + 1):
             sprint_start, sprint_end = self.get_sprint_dates(i)
             
-            # Filter logs within sprint period
-            sprint_logs = []
-            for log in self.logs:
-                log_date = datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y")
-                if sprint_start <= log_date <= sprint_end:
-                    sprint_logs.append(log)
+            # Count logs within sprint period by bisecting the sorted logs
+            logs_count = self._bisect_logs(sprint_end, after=True) - self._bisect_logs(sprint_start)
             
             # Show sprint if it has logs or is in the past
-            if sprint_logs or sprint_end < datetime.now():
+            if logs_count or sprint_end < now:
                 available_sprints.append({
                     'sprint_number': i,
                     'start_date': sprint_start,
                     'end_date': sprint_end,
-                    'logs_count': len(sprint_logs)
+                    'logs_count': logs_count
                 })
         
         if not available_sprints:
@@ -1770,8 +1962,8 @@ class BLogger:
             return None
         
         # Display sprints with numbers
-        print("\nAvailable Sprints:")
-        print("-" * 50)
+        lines = ["\nAvailable Sprints:", "-" * 50]
+        current_sprint = self.get_current_sprint_number()
         for i, sprint in enumerate(available_sprints, 1):
             sprint_num = sprint['sprint_number']
             start_date = sprint['start_date'].strftime('%d.%m.%Y')
@@ -1780,10 +1972,11 @@ class BLogger:
             
             # Mark current sprint
             current_marker = ""
-            if sprint_num == self.get_current_sprint_number():
+            if sprint_num == current_sprint:
                 current_marker = " (Current)"
             
-            print(f"{i}. Sprint {sprint_num}: {start_date} - {end_date} ({logs_count} logs){current_marker}")
+            lines.append(f"{i}. Sprint {sprint_num}: {start_date} - {end_date} ({logs_count} logs){current_marker}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Let user choose
         try:
@@ -1803,28 +1996,20 @@ class BLogger:
 
     def get_current_sprint_number(self):
         """Get the current sprint number"""
-        now = datetime.now()
-        first_sprint_start = datetime.strptime(self.settings["sprint_config"]["start_date"], "%Y-%m-%d")
-        sprint_duration = self.settings["sprint_config"]["duration_weeks"] * 7
-        days_since_first_sprint = (now - first_sprint_start).days
-        return days_since_first_sprint // sprint_duration
+        return _sprint_index(datetime.now(), *self._sprint_config())
 
     def view_specific_sprint(self, sprint_number):
         """View logs for a specific sprint number"""
-        print(self.term.clear)
-        print(self.term.move_y(0) + self.term.black_on_white + f"Sprint {sprint_number} Logs" + self.term.normal)
+        print(self._clear)
+        print(self._home + self._hdr_on + f"Sprint {sprint_number} Logs" + self._normal)
         
         # Get sprint dates
         sprint_start, sprint_end = self.get_sprint_dates(sprint_number)
         print(f"\nSprint Period: {sprint_start.strftime('%d.%m.%Y')} - {sprint_end.strftime('%d.%m.%Y')}")
-        print("-" * 72)
+        print(_SEP)
         
         # Filter logs within sprint period
-        sprint_logs = []
-        for log in self.logs:
-            log_date = datetime.strptime(log['timestamp'].split()[0], "%d.%m.%Y")
-            if sprint_start <= log_date <= sprint_end:
-                sprint_logs.append(log)
+        sprint_logs = self._logs_between(sprint_start, sprint_end)
         
         if not sprint_logs:
             print("\nNo logs found for this sprint.")
@@ -1832,190 +2017,70 @@ class BLogger:
             return
         
         # Get distinct QI- logs
-        qi_logs = {}  # Use dict to store unique QI numbers
-        for log in sprint_logs:
-            if log['ticket'].startswith('QI-'):
-                # Extract QI number (everything before the first space or [)
-                qi_number = log['ticket'].split()[0].split('[')[0]
-                # Keep the version with [Q] if it exists, otherwise keep the first one
-                if '[Q]' in log['ticket'] or qi_number not in qi_logs:
-                    qi_logs[qi_number] = log['ticket']
+        qi_logs = self._distinct_qi_tickets(sprint_logs)
         
         # Display QI logs first
         if qi_logs:
-            print("\nQI Tickets:")
-            for qi_log in sorted(qi_logs.values()):
-                print(f"  {self.term.cyan(qi_log)}")
-            print("-" * 72)
+            lines = ["\nQI Tickets:"]
+            lines.extend(f"  {self._cyan}{qi_log}{self._normal}" for qi_log in sorted(qi_logs.values()))
+            lines.append(_SEP)
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Display all logs sorted by date
         print("\nOther Logs:")
-        # Sort logs by date
-        sprint_logs.sort(key=lambda x: datetime.strptime(x['timestamp'].split()[0], "%d.%m.%Y"))
-        
-        # Group logs by date
-        current_date = None
-        for log in sprint_logs:
-            log_date = log['timestamp'].split()[0]
-            if current_date != log_date:
-                current_date = log_date
-                print(f"\n  {self.term.yellow(current_date)}")
-            print(f"    {self.term.cyan(log['ticket'])}")
+        # Already in date order: filtered from the sorted self.logs
+        self._print_tickets_by_day(sprint_logs)
         
         self.ask("\nPress Enter to continue...")
 
+    def _view_logs_and_wait(self):
+        self.display_logs()
+        self.ask("\nPress Enter to continue...")
+
+    def _view_chosen_sprint(self):
+        selected_sprint = self.list_available_sprints()
+        if selected_sprint is not None:
+            self.view_specific_sprint(selected_sprint)
+
+    def _run_submenu(self, title, menu, actions):
+        """Show a submenu until the user picks 0, running the action for each valid choice"""
+        frame = self._frame([self._hdr_on + title + self._normal, menu])  # Composed once per visit
+        prompt = f"\nEnter your choice (0-{len(actions)}): "
+        write, flush = sys.stdout.write, sys.stdout.flush
+        while True:
+            write(frame)
+            flush()
+            
+            subchoice = self.ask(prompt)
+            while subchoice != "0" and subchoice not in actions:
+                subchoice = self.ask(prompt)  # Nothing changed: ask again without repainting
+            if subchoice == "0":
+                break
+            actions[subchoice]()
+
     def run(self):
+        # Block-buffer stdout instead of flushing every line; each paint flushes explicitly
+        reconfigure = getattr(sys.stdout, "reconfigure", None)
+        if reconfigure is not None:
+            reconfigure(line_buffering=False)
         self.reset_screen()
+        actions = self._main_actions
+        write, flush = sys.stdout.write, sys.stdout.flush
+        main_menu = self._hdr_on + "B-Logger" + self._normal + "\n" + _MAIN_MENU + "\n"
         while self.running:
-            print(self.term.black_on_white + "B-Logger" + self.term.normal)
-            print("\n1. Logs")
-            print("2. Sprint")
-            print("3. Migration script")
-            print("4. Important Links")
-            print("5. Settings")
-            print("6. Help")
-            print("7. Statistics")
-            print("8. About")
-            print("9. Exit")
+            write(main_menu)
+            flush()
             
-            try:
-                choice = self.ask("\nEnter your choice (1-9): ")
-                
-                if choice == "1":  # Logs submenu
-                    while True:
-                        print(self.term.clear)
-                        print(self.term.black_on_white + "Logs Menu" + self.term.normal)
-                        print("\n1. Create log")
-                        print("2. View logs")
-                        print("3. Edit log")
-                        print("4. Delete log")
-                        print("5. Mark as checked")
-                        print("6. Mark as unchecked")
-                        print("7. Edit subtasks")
-                        print("8. View logs for a date")
-                        print("9. Mark all day as checked")
-                        print("10. Mark all day as unchecked")
-                        print("0. Back to main menu")
-                        
-                        subchoice = self.ask("\nEnter your choice (0-10): ")
-                        if subchoice == "0":
-                            break
-                        elif subchoice == "1":
-                            self.create_new_log()
-                        elif subchoice == "2":
-                            self.display_logs()
-                            self.ask("\nPress Enter to continue...")
-                        elif subchoice == "3":
-                            self.edit_log()
-                        elif subchoice == "4":
-                            self.delete_log()
-                        elif subchoice == "5":
-                            self.mark_as_checked()
-                        elif subchoice == "6":
-                            self.mark_as_unchecked()
-                        elif subchoice == "7":
-                            self.edit_subtasks()
-                        elif subchoice == "8":
-                            self.view_logs_for_date()
-                        elif subchoice == "9":
-                            self.mark_all_day_as_checked()
-                        elif subchoice == "10":
-                            self.mark_all_day_as_unchecked()
-                        self.reset_screen()
-                
-                elif choice == "2":  # Sprint submenu
-                    while True:
-                        print(self.term.clear)
-                        print(self.term.black_on_white + "Sprint Menu" + self.term.normal)
-                        print("\n1. View current sprint")
-                        print("2. View sprint by date")
-                        print("3. View sprint history")
-                        print("0. Back to main menu")
-                        
-                        subchoice = self.ask("\nEnter your choice (0-3): ")
-                        if subchoice == "0":
-                            break
-                        elif subchoice == "1":
-                            self.view_sprint_logs()
-                        elif subchoice == "2":
-                            selected_sprint = self.list_available_sprints()
-                            if selected_sprint is not None:
-                                self.view_specific_sprint(selected_sprint)
-                        elif subchoice == "3":
-                            self.view_sprint_history()
-                        self.reset_screen()
-                
-                elif choice == "3":  # Migration script submenu
-                    while True:
-                        print(self.term.clear)
-                        print(self.term.black_on_white + "Migration Script Menu" + self.term.normal)
-                        print("\n1. Create migration script")
-                        print("2. View migration scripts")
-                        print("3. Edit migration script")
-                        print("4. Delete migration script")
-                        print("0. Back to main menu")
-                        
-                        subchoice = self.ask("\nEnter your choice (0-4): ")
-                        if subchoice == "0":
-                            break
-                        elif subchoice == "1":
-                            self.log_migration_script()
-                        elif subchoice == "2":
-                            self.view_migration_scripts()
-                        elif subchoice == "3":
-                            self.edit_migration_script()
-                        elif subchoice == "4":
-                            self.delete_migration_script()
-                        self.reset_screen()
-                
-                elif choice == "4":  # Important Links submenu
-                    while True:
-                        print(self.term.clear)
-                        print(self.term.black_on_white + "Important Links Menu" + self.term.normal)
-                        print("\n1. Add link")
-                        print("2. View links")
-                        print("3. Edit link")
-                        print("4. Delete link")
-                        print("0. Back to main menu")
-                        
-                        subchoice = self.ask("\nEnter your choice (0-4): ")
-                        if subchoice == "0":
-                            break
-                        elif subchoice == "1":
-                            self.add_link()
-                        elif subchoice == "2":
-                            self.view_links()
-                        elif subchoice == "3":
-                            self.edit_link()
-                        elif subchoice == "4":
-                            self.delete_link()
-                        self.reset_screen()
-                
-                elif choice == "5":
-                    self.manage_settings()
-                    self.reset_screen()
-                
-                elif choice == "6":
-                    self.display_help()
-                    self.reset_screen()
-                
-                elif choice == "7":
-                    self.display_statistics()
-                    self.reset_screen()
-                
-                elif choice == "8":
-                    self.display_about()
-                    self.reset_screen()
-                
-                elif choice == "9":
-                    self.running = False
-                    break
-                
-                self.reset_screen()
-            except KeyboardInterrupt:
-                print("\nExiting B-LOGGER...")
+            # Ctrl+C never reaches here as KeyboardInterrupt: handle_exit owns SIGINT
+            choice = self.ask("\nEnter your choice (1-9): ")
+            while choice != "9" and choice not in actions:
+                choice = self.ask("\nEnter your choice (1-9): ")  # Nothing changed: ask again without repainting
+            if choice == "9":
                 self.running = False
                 break
+            
+            actions[choice]()
+            self.reset_screen()
 
 if __name__ == "__main__":
     logger = BLogger()